@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 import joblib
 import os
@@ -12,6 +14,10 @@ from .base_agent import BaseAgent, AgentTask, AgentStatus, TaskPriority
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Worker threads for model inference, so vectorizing and predicting never block the event loop
+_INFERENCE_EXECUTOR = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2),
+                                         thread_name_prefix="analyst-inference")
+
 
 def text_length(text):
     """Returns character length of text."""
@@ -206,6 +212,49 @@ class AnalystAgent(BaseAgent):
         except Exception as e:
             logger.error(f"[{self.agent_name}] Error loading ML models: {e}")
     
+    def predict_suspicion(self, claim_text: str) -> float:
+        """
+        Run the loaded models on the claim text (blocking; called from a worker thread).
+        
+        Args:
+            claim_text (str): The claim text
+            
+        Returns:
+            float: The probability that the claim is misinformation
+        """
+        # Check if we're using the enhanced model (has scaler)
+        if self.scaler is not None:
+            # Enhanced model with feature engineering
+            logger.debug(f"[{self.agent_name}] Using enhanced model with feature engineering")
+            
+            # Vectorize the claim text
+            claim_vector_tfidf = self.vectorizer.transform([claim_text])
+            
+            # Extract engineered features
+            engineered_features = get_text_features([claim_text])
+            engineered_features_scaled = self.scaler.transform(engineered_features)
+            engineered_features_sparse = csr_matrix(engineered_features_scaled)
+            
+            # Combine features
+            claim_vector_combined = hstack([claim_vector_tfidf, engineered_features_sparse])
+            
+            # Predict probability for class 1 (misinformation/fake)
+            suspicion_probability = self.classifier.predict_proba(claim_vector_combined)[0][1]
+            logger.info(f"[{self.agent_name}] Text suspicion score (enhanced model): {suspicion_probability:.4f}")
+        else:
+            # Original model
+            logger.debug(f"[{self.agent_name}] Using original model")
+            
+            # Vectorize the claim text
+            claim_vector = self.vectorizer.transform([claim_text])
+            logger.debug(f"[{self.agent_name}] Claim vectorized successfully")
+            
+            # Predict probability for class 1 (misinformation/fake)
+            suspicion_probability = self.classifier.predict_proba(claim_vector)[0][1]
+            logger.info(f"[{self.agent_name}] Text suspicion score: {suspicion_probability:.4f}")
+        
+        return suspicion_probability
+    
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
         """
         Process a task to analyze claim text.
@@ -238,36 +287,9 @@ class AnalystAgent(BaseAgent):
             }
         
         try:
-            # Check if we're using the enhanced model (has scaler)
-            if self.scaler is not None:
-                # Enhanced model with feature engineering
-                logger.debug(f"[{self.agent_name}] Using enhanced model with feature engineering")
-                
-                # Vectorize the claim text
-                claim_vector_tfidf = self.vectorizer.transform([claim_text])
-                
-                # Extract engineered features
-                engineered_features = get_text_features([claim_text])
-                engineered_features_scaled = self.scaler.transform(engineered_features)
-                engineered_features_sparse = csr_matrix(engineered_features_scaled)
-                
-                # Combine features
-                claim_vector_combined = hstack([claim_vector_tfidf, engineered_features_sparse])
-                
-                # Predict probability for class 1 (misinformation/fake)
-                suspicion_probability = self.classifier.predict_proba(claim_vector_combined)[0][1]
-                logger.info(f"[{self.agent_name}] Text suspicion score (enhanced model): {suspicion_probability:.4f}")
-            else:
-                # Original model
-                logger.debug(f"[{self.agent_name}] Using original model")
-                
-                # Vectorize the claim text
-                claim_vector = self.vectorizer.transform([claim_text])
-                logger.debug(f"[{self.agent_name}] Claim vectorized successfully")
-                
-                # Predict probability for class 1 (misinformation/fake)
-                suspicion_probability = self.classifier.predict_proba(claim_vector)[0][1]
-                logger.info(f"[{self.agent_name}] Text suspicion score: {suspicion_probability:.4f}")
+            # Run inference in a worker thread so other requests keep being served
+            loop = asyncio.get_running_loop()
+            suspicion_probability = await loop.run_in_executor(_INFERENCE_EXECUTOR, self.predict_suspicion, claim_text)
             
             return {
                 "claim_text": claim_text,
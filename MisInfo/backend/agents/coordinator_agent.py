@@ -1,12 +1,12 @@
 import asyncio
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 
 from .base_agent import AgentCoordinator, AgentTask, TaskPriority
-from .scout_agent import ScoutAgent
+from .scout_agent import ScoutAgent, canonicalize_url
 from .analyst_agent import AnalystAgent
 from .research_agent import ResearchAgent
 from .source_profiler_agent import SourceProfilerAgent
@@ -18,15 +18,38 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _claim_row_key(source_metadata, claim_text: str) -> str:
+    """
+    Key that ties an inserted raw_claims row back to the claim it came from.
+    
+    Args:
+        source_metadata: The row's source_metadata_json, as a JSON string or an already-decoded dict
+        claim_text (str): The claim text, used when the metadata has no source URL
+        
+    Returns:
+        str: The canonical source URL, or the claim text
+    """
+    if isinstance(source_metadata, str):
+        try:
+            source_metadata = json.loads(source_metadata)
+        except json.JSONDecodeError:
+            source_metadata = {}
+    source_url = source_metadata.get("source_url") if isinstance(source_metadata, dict) else None
+    return canonicalize_url(source_url) if source_url else claim_text
+
+
 class CoordinatorAgent:
     """Agent responsible for coordinating the entire fact-checking workflow"""
     
     def __init__(self, supabase_client=None, model_path=".", websocket_manager=None,
                  scout_agent=None, analyst_agent=None, research_agent=None, 
-                 source_agent=None, investigator_agent=None, herald_agent=None):
+                 source_agent=None, investigator_agent=None, herald_agent=None,
+                 on_verified_claims_written: Optional[Callable[[], None]] = None):
         self.supabase_client = supabase_client
         self.model_path = model_path
         self.websocket_manager = websocket_manager
+        # Called after each verified_claims insert, e.g. to expire a cached dashboard payload
+        self.on_verified_claims_written = on_verified_claims_written
         self.coordinator = AgentCoordinator()
         
         # Initialize all agents (use provided agents or create new ones)
@@ -75,22 +98,29 @@ class CoordinatorAgent:
                     try:
                         logger.info("=== DISCOVERY PHASE ===")
                         
-                        # Get existing claim URLs from database for duplicate checking
+                        # Get existing claim URLs from database for duplicate checking, unless the
+                        # scout already has a populated shared (Redis) URL store
                         existing_claim_urls = set()
-                        try:
-                            response = self.supabase_client.table("raw_claims").select("source_metadata_json").execute()
-                            if response.data:
-                                for claim_data in response.data:
-                                    try:
-                                        metadata = json.loads(claim_data["source_metadata_json"])
-                                        url = metadata.get("source_url")
-                                        if url:
-                                            existing_claim_urls.add(url)
-                                    except json.JSONDecodeError:
-                                        continue
-                            logger.info(f"[Coordinator] Loaded {len(existing_claim_urls)} existing claim URLs for duplicate checking")
-                        except Exception as db_error:
-                            logger.warning(f"[Coordinator] Could not load existing claim URLs: {db_error}")
+                        has_shared_url_store = hasattr(self.scout_agent, 'has_shared_url_store') and await self.scout_agent.has_shared_url_store()
+                        if not has_shared_url_store:
+                            try:
+                                response = self.supabase_client.table("raw_claims").select("source_metadata_json").execute()
+                                if response.data:
+                                    for claim_data in response.data:
+                                        try:
+                                            metadata = json.loads(claim_data["source_metadata_json"])
+                                            url = metadata.get("source_url")
+                                            if url:
+                                                existing_claim_urls.add(canonicalize_url(url))
+                                        except json.JSONDecodeError:
+                                            continue
+                                logger.info(f"[Coordinator] Loaded {len(existing_claim_urls)} existing claim URLs for duplicate checking")
+                                
+                                # Seed the shared store so later cycles can skip this table scan
+                                if hasattr(self.scout_agent, 'remember_claim_urls'):
+                                    await self.scout_agent.remember_claim_urls(existing_claim_urls)
+                            except Exception as db_error:
+                                logger.warning(f"[Coordinator] Could not load existing claim URLs: {db_error}")
                         
                         # Call Scout Agent with existing URLs for persistent duplicate checking
                         scout_task = AgentTask(
@@ -117,51 +147,33 @@ class CoordinatorAgent:
                         claims_to_process = discovered_claims[:1] if discovered_claims else []
                         
                         # Insert discovered claims into database
-                        inserted_count = 0
-                        duplicate_count = 0
+                        inserted_claims, duplicate_count = self.insert_discovered_claims(claims_to_process, active_event_id)
+                        inserted_count = len(inserted_claims)
                         
-                        for claim in claims_to_process:
-                            try:
-                                # Construct claim data for database
-                                claim_data = {
-                                    "event_id": active_event_id,
-                                    "claim_text": claim["claim_text"],
-                                    "source_metadata_json": claim["source_metadata_json"],
-                                    "status": "pending_initial_analysis"
-                                }
-                                
-                                # Insert into raw_claims table
-                                response = self.supabase_client.table("raw_claims").insert(claim_data).execute()
-                                
-                                if response.data:
-                                    inserted_count += 1
-                                    claim_id = response.data[0].get("claim_id")
-                                    logger.info(f"[Coordinator] Inserted claim {claim_id}: {claim['claim_text'][:50]}...")
-                                    
-                                    # Log this insertion
-                                    log_entry = {
-                                        "log_message": f"Scout discovered and inserted new claim: {claim['claim_text'][:50]}..."
-                                    }
-                                    self.supabase_client.table("system_logs").insert(log_entry).execute()
-                                    
-                            except Exception as insert_error:
-                                # Handle duplicate entries or other database errors
-                                error_msg = str(insert_error)
-                                if "duplicate" in error_msg.lower() or "unique" in error_msg.lower():
-                                    duplicate_count += 1
-                                    logger.debug(f"[Coordinator] Duplicate claim skipped: {claim['claim_text'][:50]}...")
-                                else:
-                                    logger.error(f"[Coordinator] Error inserting claim: {insert_error}")
-                                continue
+                        # One system_logs write for the per-claim entries and the cycle summary
+                        log_entries = [
+                            {"log_message": f"Scout discovered and inserted new claim: {claim['claim_text'][:50]}..."}
+                            for claim, _ in inserted_claims
+                        ]
+                        
+                        if inserted_claims:
+                            # Record the URLs and text in the scout's duplicate stores
+                            if hasattr(self.scout_agent, 'remember_claim_urls'):
+                                await self.scout_agent.remember_claim_urls([claim.get("source_url") for claim, _ in inserted_claims])
+                            if hasattr(self.scout_agent, 'remember_claim_text'):
+                                for claim, _ in inserted_claims:
+                                    self.scout_agent.remember_claim_text(claim.get("source_url"), claim["claim_text"])
                         
                         # Log discovery summary
                         if inserted_count > 0 or duplicate_count > 0:
-                            log_entry = {
+                            log_entries.append({
                                 "log_message": f"Scout discovery cycle: {len(claims_to_process)} processed, {inserted_count} new, {duplicate_count} duplicates."
-                            }
-                            self.supabase_client.table("system_logs").insert(log_entry).execute()
+                            })
                             logger.info(f"[Coordinator] Discovery summary: {len(claims_to_process)} processed, {inserted_count} new, {duplicate_count} duplicates")
                         
+                        if log_entries:
+                            self.supabase_client.table("system_logs").insert(log_entries).execute()
+                        
                     except Exception as scout_error:
                         logger.error(f"[Coordinator] Error in Scout Agent discovery: {scout_error}")
                         # Log the error
@@ -228,6 +240,77 @@ class CoordinatorAgent:
             logger.error(f"Error getting or creating active event: {e}")
             return None
 
+    def insert_discovered_claims(self, claims: List[Dict[str, Any]], event_id) -> Tuple[List[Tuple[Dict[str, Any], Dict[str, Any]]], int]:
+        """
+        Insert discovered claims into raw_claims with a single request.
+        
+        A duplicate anywhere rejects the whole batch, so on failure the claims are retried
+        one at a time to keep the rest.
+        
+        Args:
+            claims (List[Dict[str, Any]]): Claims returned by the Scout Agent
+            event_id: The active event ID
+            
+        Returns:
+            Tuple[List[Tuple[Dict[str, Any], Dict[str, Any]]], int]: (claim, inserted row) pairs and the duplicate count
+        """
+        rows = [
+            {
+                "event_id": event_id,
+                "claim_text": claim["claim_text"],
+                "source_metadata_json": claim["source_metadata_json"],
+                "status": "pending_initial_analysis"
+            }
+            for claim in claims
+        ]
+        if not rows:
+            return [], 0
+        
+        try:
+            response = self.supabase_client.table("raw_claims").insert(rows).execute()
+            
+            # Match returned rows to claims by canonical source URL; PostgREST doesn't promise input order
+            claims_by_key = {_claim_row_key(claim["source_metadata_json"], claim["claim_text"]): claim for claim in claims}
+            inserted = []
+            for row in response.data or []:
+                claim = claims_by_key.pop(_claim_row_key(row.get("source_metadata_json"), row.get("claim_text", "")), None)
+                if claim is None:
+                    logger.warning(f"[Coordinator] Inserted row {row.get('claim_id')} matches no submitted claim")
+                    continue
+                inserted.append((claim, row))
+                logger.info(f"[Coordinator] Inserted claim {row.get('claim_id')}: {claim['claim_text'][:50]}...")
+            if claims_by_key:
+                logger.warning(f"[Coordinator] Batch insert returned no row for {len(claims_by_key)} claims")
+            return inserted, 0
+        except Exception as batch_error:
+            if len(rows) > 1:
+                logger.debug(f"[Coordinator] Batch claim insert failed, retrying individually: {batch_error}")
+            else:
+                error_msg = str(batch_error).lower()
+                if "duplicate" in error_msg or "unique" in error_msg:
+                    logger.debug(f"[Coordinator] Duplicate claim skipped: {claims[0]['claim_text'][:50]}...")
+                    return [], 1
+                logger.error(f"[Coordinator] Error inserting claim: {batch_error}")
+                return [], 0
+        
+        inserted = []
+        duplicate_count = 0
+        for claim, row in zip(claims, rows):
+            try:
+                response = self.supabase_client.table("raw_claims").insert(row).execute()
+                if response.data:
+                    inserted.append((claim, response.data[0]))
+                    logger.info(f"[Coordinator] Inserted claim {response.data[0].get('claim_id')}: {claim['claim_text'][:50]}...")
+            except Exception as insert_error:
+                # Handle duplicate entries or other database errors
+                error_msg = str(insert_error).lower()
+                if "duplicate" in error_msg or "unique" in error_msg:
+                    duplicate_count += 1
+                    logger.debug(f"[Coordinator] Duplicate claim skipped: {claim['claim_text'][:50]}...")
+                else:
+                    logger.error(f"[Coordinator] Error inserting claim: {insert_error}")
+        return inserted, duplicate_count
+    
     async def discover_claims(self) -> List[Dict[str, Any]]:
         """Discover new claims using the Scout Agent"""
         logger.info("=== DISCOVERY PHASE ===")
@@ -332,7 +415,7 @@ class CoordinatorAgent:
             task_id=self.generate_task_id(),
             agent_type="InvestigatorAgent",
             priority=TaskPriority.HIGH,
-            payload={"case_file_json": json.dumps(case_file)},
+            payload={"case_file": case_file},
             created_at=datetime.now()
         )
         
@@ -353,7 +436,7 @@ class CoordinatorAgent:
             task_id=self.generate_task_id(),
             agent_type="HeraldAgent",
             priority=TaskPriority.NORMAL,
-            payload={"investigator_report_json": json.dumps(investigation_result)},
+            payload={"investigator_report": investigation_result},
             created_at=datetime.now()
         )
         
@@ -364,6 +447,23 @@ class CoordinatorAgent:
         claim_data["public_alert"] = public_alert
         return claim_data
     
+    def _write_initial_scores(self, claim_id, text_suspicion_score: float, source_credibility_score: float):
+        """
+        Store a claim's analysis scores and move it on to the fusion decision.
+        
+        Args:
+            claim_id: The claim's ID
+            text_suspicion_score (float): The AnalystAgent score
+            source_credibility_score (float): The source credibility score
+        """
+        update_data = {
+            "text_suspicion_score": text_suspicion_score,
+            "source_credibility_score": source_credibility_score,
+            "status": "pending_fusion_decision"
+        }
+        self.supabase_client.table("raw_claims").update(update_data).eq("claim_id", claim_id).execute()
+        logger.info(f"[Coordinator] Claim {claim_id} updated with scores")
+    
     async def process_pending_initial_analysis(self):
         """Process claims pending initial analysis"""
         if not self.supabase_client:
@@ -375,78 +475,92 @@ class CoordinatorAgent:
             pending_claims = response.data
             logger.info(f"[Coordinator] Found {len(pending_claims)} claims for initial analysis")
             
+            # Neutral-scored claims wait for one batched Gemini credibility check; every
+            # other claim is written back as soon as it is scored
+            pending_gemini = []
+            
             for claim in pending_claims:
                 claim_id = claim["claim_id"]
-                claim_text = claim["claim_text"]
-                source_metadata_json = claim["source_metadata_json"]
-                
-                logger.info(f"[Coordinator] Analyzing claim {claim_id}: {claim_text[:50]}...")
-                
-                # Run analyst agent
-                analyst_task = AgentTask(
-                    task_id=self.generate_task_id(),
-                    agent_type="AnalystAgent",
-                    priority=TaskPriority.NORMAL,
-                    payload={"claim_text": claim_text},
-                    created_at=datetime.now()
-                )
-                analyst_result = await self.analyst_agent.process_task(analyst_task)
-                
-                # Handle honest failure from AnalystAgent
-                text_suspicion_score = analyst_result.get("text_suspicion_score")
-                if text_suspicion_score is None:
-                    status = analyst_result.get("status", "unknown")
-                    error = analyst_result.get("error", "Unknown error")
-                    logger.error(f"[Coordinator] AnalystAgent failed for claim {claim_id}: {status} - {error}")
-                    # Mark claim for manual review when analysis fails
-                    update_data = {
-                        "status": "pending_manual_review",
-                        "analysis_error": f"Analysis failed: {error}"
-                    }
-                    self.supabase_client.table("raw_claims").update(update_data).eq("claim_id", claim_id).execute()
-                    logger.info(f"[Coordinator] Claim {claim_id} marked for manual review due to analysis failure")
-                    continue  # Skip to next claim
-                
-                # Run source profiler agent
-                profiler_task = AgentTask(
-                    task_id=self.generate_task_id(),
-                    agent_type="SourceProfilerAgent",
-                    priority=TaskPriority.NORMAL,
-                    payload={"source_metadata_json": source_metadata_json},
-                    created_at=datetime.now()
-                )
-                profiler_result = await self.source_profiler_agent.process_task(profiler_task)
-                source_credibility_score = profiler_result["source_credibility_score"]
-                
-                # Add safety check for None scores or specific status
-                if text_suspicion_score is None or source_credibility_score is None:
-                    logger.warning(f"[Coordinator] Claim {claim_id} has missing scores (Analysis: {text_suspicion_score}, Source: {source_credibility_score}). Skipping processing.")
-                    continue  # Skip to next claim
-                
-                # Check if source credibility score is neutral (0.5) and trigger Gemini source check
-                if source_credibility_score == 0.5:
-                    logger.info(f"[Coordinator] Triggering Gemini source credibility check for claim {claim_id}")
+                try:
+                    claim_text = claim["claim_text"]
+                    source_metadata_json = claim["source_metadata_json"]
+                    
+                    logger.info(f"[Coordinator] Analyzing claim {claim_id}: {claim_text[:50]}...")
+                    
+                    # Run analyst agent
+                    analyst_task = AgentTask(
+                        task_id=self.generate_task_id(),
+                        agent_type="AnalystAgent",
+                        priority=TaskPriority.NORMAL,
+                        payload={"claim_text": claim_text},
+                        created_at=datetime.now()
+                    )
+                    analyst_result = await self.analyst_agent.process_task(analyst_task)
+                    
+                    # Handle honest failure from AnalystAgent
+                    text_suspicion_score = analyst_result.get("text_suspicion_score")
+                    if text_suspicion_score is None:
+                        status = analyst_result.get("status", "unknown")
+                        error = analyst_result.get("error", "Unknown error")
+                        logger.error(f"[Coordinator] AnalystAgent failed for claim {claim_id}: {status} - {error}")
+                        # Mark claim for manual review when analysis fails
+                        update_data = {
+                            "status": "pending_manual_review",
+                            "analysis_error": f"Analysis failed: {error}"
+                        }
+                        self.supabase_client.table("raw_claims").update(update_data).eq("claim_id", claim_id).execute()
+                        logger.info(f"[Coordinator] Claim {claim_id} marked for manual review due to analysis failure")
+                        continue  # Skip to next claim
+                    
+                    # Run source profiler agent
+                    profiler_task = AgentTask(
+                        task_id=self.generate_task_id(),
+                        agent_type="SourceProfilerAgent",
+                        priority=TaskPriority.NORMAL,
+                        payload={"source_metadata_json": source_metadata_json},
+                        created_at=datetime.now()
+                    )
+                    profiler_result = await self.source_profiler_agent.process_task(profiler_task)
+                    source_credibility_score = profiler_result["source_credibility_score"]
+                    
+                    # Add safety check for None scores or specific status
+                    if text_suspicion_score is None or source_credibility_score is None:
+                        logger.warning(f"[Coordinator] Claim {claim_id} has missing scores (Analysis: {text_suspicion_score}, Source: {source_credibility_score}). Skipping processing.")
+                        continue  # Skip to next claim
                     
-                    # Extract source name and URL from profiler result
-                    source_metadata = profiler_result.get("source_metadata", {})
-                    source_name = source_metadata.get("source_name", "Unknown Source")
-                    source_url = source_metadata.get("source_url", "")
+                    # Check if source credibility score is neutral (0.5) and queue a Gemini source check
+                    if source_credibility_score == 0.5:
+                        logger.info(f"[Coordinator] Queuing Gemini source credibility check for claim {claim_id}")
                     
-                    # Call the new investigator method to assess source credibility
-                    gemini_score = await self.investigator_agent.assess_source_credibility(source_name, source_url)
-                    logger.info(f"[Coordinator] Gemini source credibility score for '{source_name}': {gemini_score}")
+                        # Extract source name and URL from profiler result
+                        source_metadata = profiler_result.get("source_metadata", {})
+                        source = (source_metadata.get("source_name") or "Unknown Source", source_metadata.get("source_url") or "")
+                        pending_gemini.append((claim_id, text_suspicion_score, source))
+                        continue
                     
-                    # Update the source_credibility_score variable with the Gemini score
-                    source_credibility_score = gemini_score
+                    self._write_initial_scores(claim_id, text_suspicion_score, source_credibility_score)
+                except Exception as e:
+                    # One bad claim (e.g. malformed source metadata) must not stall the rest
+                    logger.error(f"[Coordinator] Error analyzing claim {claim_id}: {e}")
+            
+            # Assess all neutral sources with a single Gemini call
+            if pending_gemini:
+                try:
+                    gemini_scores = await self.investigator_agent.assess_sources_credibility(
+                        [source for _, _, source in pending_gemini]
+                    )
+                    logger.info(f"[Coordinator] Gemini source credibility scores: {gemini_scores}")
+                except Exception as e:
+                    # Keep the neutral score rather than leaving every queued claim pending
+                    logger.error(f"[Coordinator] Error in batched source credibility check, keeping neutral scores: {e}")
+                    gemini_scores = {}
                 
-                # Update claim with scores
-                update_data = {
-                    "text_suspicion_score": text_suspicion_score,
-                    "source_credibility_score": source_credibility_score,
-                    "status": "pending_fusion_decision"
-                }
-                self.supabase_client.table("raw_claims").update(update_data).eq("claim_id", claim_id).execute()
-                logger.info(f"[Coordinator] Claim {claim_id} updated with scores")
+                for claim_id, text_suspicion_score, source in pending_gemini:
+                    try:
+                        # Replace the neutral score with the Gemini score
+                        self._write_initial_scores(claim_id, text_suspicion_score, gemini_scores.get(source, 0.5))
+                    except Exception as e:
+                        logger.error(f"[Coordinator] Error updating claim {claim_id} with scores: {e}")
 
         except Exception as e:
             logger.error(f"[Coordinator] Error in initial analysis: {e}")
@@ -658,6 +772,8 @@ class CoordinatorAgent:
                     }
                     
                     self.supabase_client.table("verified_claims").insert(result_data).execute()
+                    if self.on_verified_claims_written:
+                        self.on_verified_claims_written()
                     
                     update_data = {"status": "resolved_by_fusion"}
                     self.supabase_client.table("raw_claims").update(update_data).eq("claim_id", claim_id).execute()
@@ -711,7 +827,7 @@ class CoordinatorAgent:
                     task_id=self.generate_task_id(),
                     agent_type="InvestigatorAgent",
                     priority=TaskPriority.HIGH,
-                    payload={"case_file_json": json.dumps(case_file)},
+                    payload={"case_file": case_file},
                     created_at=datetime.now()
                 )
                 
@@ -725,7 +841,7 @@ class CoordinatorAgent:
                         task_id=self.generate_task_id(),
                         agent_type="HeraldAgent",
                         priority=TaskPriority.NORMAL,
-                        payload={"investigator_report_json": json.dumps(investigation_result)},
+                        payload={"investigator_report": investigation_result},
                         created_at=datetime.now()
                     )
                     herald_result = await self.herald_agent.process_task(herald_task)
@@ -746,6 +862,8 @@ class CoordinatorAgent:
                     }
                     
                     self.supabase_client.table("verified_claims").insert(result_data).execute()
+                    if self.on_verified_claims_written:
+                        self.on_verified_claims_written()
                     logger.info(f"[Coordinator] Verified claim inserted for claim {claim_id}")
                     
                     # Update status to resolved
@@ -6,6 +6,7 @@ Generates public alerts based on investigation results
 import logging
 from typing import Dict, Any
 import json
+import orjson
 
 from .base_agent import BaseAgent, AgentTask, AgentStatus, TaskPriority
 from backend.prompts import HERALD_PROTOCOL
@@ -32,7 +33,7 @@ class HeraldAgent(BaseAgent):
             str: Formatted public alert string
         """
         logger.info(f"[{self.agent_name}] Generating public alert")
-        logger.debug(f"[{self.agent_name}] Report: {json.dumps(investigator_report, indent=2)}")
+        logger.debug("[%s] Report: %s", self.agent_name, investigator_report)
         
         verdict = investigator_report.get("verdict", "Misleading")
         confidence = investigator_report.get("confidence", 0.5)
@@ -70,13 +71,16 @@ class HeraldAgent(BaseAgent):
         """
         logger.info(f"[{self.agent_name}] Processing alert generation task {task.task_id}")
         
-        # Extract investigator report from payload
-        investigator_report_json = task.payload.get("investigator_report_json", "{}")
-        
-        try:
-            investigator_report = json.loads(investigator_report_json)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in investigator_report_json: {e}")
+        # In-process callers pass the report dict directly; parse JSON only when it
+        # crossed a serialization boundary
+        investigator_report = task.payload.get("investigator_report")
+        if investigator_report is None:
+            investigator_report_json = task.payload.get("investigator_report_json", "{}")
+            
+            try:
+                investigator_report = orjson.loads(investigator_report_json)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in investigator_report_json: {e}")
         
         # Generate the public alert
         alert_message = self.generate_alert(investigator_report)
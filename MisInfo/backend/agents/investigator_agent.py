@@ -3,23 +3,201 @@ Project Aegis - Investigator Agent
 Expert fact-checking agent that analyzes evidence and makes final determinations
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import json
 import os
-import urllib.parse
+import numpy as np
+import orjson
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from .base_agent import BaseAgent, AgentTask, AgentStatus, TaskPriority
+from .url_utils import extract_host
 from backend.prompts import INVESTIGATOR_MANDATE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fixed investigator prompt prefix, built once instead of per Gemini call
+_PROMPT_HEAD = f"{INVESTIGATOR_MANDATE}\n\nCASE FILE:\n"
+
+# Structured-output configs so Gemini returns strict JSON matching these schemas
+VERDICT_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "OBJECT",
+        "properties": {
+            "verdict": {"type": "STRING", "format": "enum", "enum": ["True", "False", "Misleading"]},
+            "confidence": {"type": "NUMBER"},
+            "reasoning": {"type": "STRING"}
+        },
+        "required": ["verdict", "confidence", "reasoning"]
+    }
+}
+
+CREDIBILITY_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "OBJECT",
+        "properties": {
+            "score": {"type": "NUMBER"},
+            "justification": {"type": "STRING"}
+        },
+        "required": ["score", "justification"]
+    }
+}
+
+BATCH_CREDIBILITY_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "id": {"type": "INTEGER"},
+                "score": {"type": "NUMBER"},
+                "justification": {"type": "STRING"}
+            },
+            "required": ["id", "score", "justification"]
+        }
+    }
+}
+
+
+# Minimum confidence for a score-only verdict to skip the Gemini call entirely
+FAST_VERDICT_MIN_CONFIDENCE = 0.9
+
+
+# Indexed by is_false + 2 * is_true; index 0 means the scores are inconclusive
+_FAST_VERDICT_TABLE = (
+    None,
+    {
+        "verdict": "False",
+        "confidence": 0.9,
+        "reasoning": "High suspicion score and low source credibility indicate misinformation."
+    },
+    {
+        "verdict": "True",
+        "confidence": 0.8,
+        "reasoning": "Low suspicion score and high source credibility suggest authentic information."
+    }
+)
+
+
+def _fast_verdict(text_suspicion_score: Optional[float], source_credibility_score: Optional[float]) -> Optional[Dict[str, Any]]:
+    """
+    Decide a verdict from the precomputed scores alone when they are decisive.
+    
+    Args:
+        text_suspicion_score (Optional[float]): The ML text suspicion score
+        source_credibility_score (Optional[float]): The source credibility score
+        
+    Returns:
+        Optional[Dict[str, Any]]: The verdict dict, or None if the scores are inconclusive
+    """
+    if text_suspicion_score is None or source_credibility_score is None:
+        return None
+    
+    # The two decisive regions are disjoint, so their masks index the table directly
+    is_false = (text_suspicion_score > 0.8) & (source_credibility_score < 0.3)
+    is_true = (text_suspicion_score < 0.3) & (source_credibility_score > 0.7)
+    verdict = _FAST_VERDICT_TABLE[is_false + 2 * is_true]
+    return dict(verdict) if verdict else None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _batch_verdict_codes(text_scores, source_scores):
+        """Compute _FAST_VERDICT_TABLE indices for score arrays in one native pass"""
+        codes = np.empty(text_scores.shape[0], dtype=np.int8)
+        for i in prange(text_scores.shape[0]):
+            is_false = (text_scores[i] > 0.8) & (source_scores[i] < 0.3)
+            is_true = (text_scores[i] < 0.3) & (source_scores[i] > 0.7)
+            codes[i] = is_false + 2 * is_true
+        return codes
+else:
+    def _batch_verdict_codes(text_scores, source_scores):
+        """Compute _FAST_VERDICT_TABLE indices for score arrays with NumPy (Numba not installed)"""
+        is_false = (text_scores > 0.8) & (source_scores < 0.3)
+        is_true = (text_scores < 0.3) & (source_scores > 0.7)
+        return (is_false + 2 * is_true).astype(np.int8)
+
+
+def batch_fast_verdicts(text_suspicion_scores: List[Optional[float]], source_credibility_scores: List[Optional[float]]) -> List[Optional[Dict[str, Any]]]:
+    """
+    Apply _fast_verdict to many claims at once.
+    
+    Args:
+        text_suspicion_scores (List[Optional[float]]): Text suspicion scores, one per claim
+        source_credibility_scores (List[Optional[float]]): Source credibility scores, one per claim
+        
+    Returns:
+        List[Optional[Dict[str, Any]]]: A verdict dict per claim, or None where the scores are inconclusive
+    """
+    # Missing scores become NaN, which fails every comparison and maps to "inconclusive"
+    text_scores = np.array(text_suspicion_scores, dtype=np.float64)
+    source_scores = np.array(source_credibility_scores, dtype=np.float64)
+    codes = _batch_verdict_codes(text_scores, source_scores)
+    return [dict(_FAST_VERDICT_TABLE[code]) if code else None for code in codes.tolist()]
+
+
+# Fixed credibility priors for well-known domains (checked before calling Gemini)
+_DOMAIN_PRIOR = {
+    # Wire services and established outlets
+    "reuters.com": 0.95, "apnews.com": 0.95, "bbc.co.uk": 0.9, "bbc.com": 0.9,
+    "npr.org": 0.9, "pbs.org": 0.9, "theguardian.com": 0.85, "nytimes.com": 0.85,
+    "washingtonpost.com": 0.85, "wsj.com": 0.85, "bloomberg.com": 0.85, "ft.com": 0.85,
+    "economist.com": 0.85, "cbc.ca": 0.85, "abc.net.au": 0.85, "aljazeera.com": 0.8,
+    "dw.com": 0.85, "france24.com": 0.8, "nature.com": 0.95, "scientificamerican.com": 0.9,
+    # Satire and known misinformation sites
+    "theonion.com": 0.05, "clickhole.com": 0.05, "babylonbee.com": 0.05, "empirenews.net": 0.05,
+    "infowars.com": 0.05, "naturalnews.com": 0.05, "prisonplanet.com": 0.05, "beforeitsnews.com": 0.05,
+    "yournewswire.com": 0.05, "worldtruth.tv": 0.05, "newspunch.com": 0.05, "worldnewsdailyreport.com": 0.05
+}
+
+
+def _domain_prior(domain_name: str) -> Optional[float]:
+    """Return the fixed credibility prior for a domain, ignoring case and a leading 'www.'"""
+    domain_name = domain_name.lower()
+    if domain_name.startswith("www."):
+        domain_name = domain_name[4:]
+    return _DOMAIN_PRIOR.get(domain_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model(api_key: str):
+    """
+    Configure the Gemini client and build the GenerativeModel once per API key.
+    
+    genai.configure mutates global state, so every agent shares the same model
+    (and its underlying HTTP connections) instead of reconfiguring on construction.
+    
+    Args:
+        api_key (str): The Gemini API key
+        
+    Returns:
+        The shared GenerativeModel instance
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    # Use a more stable model name
+    return genai.GenerativeModel('gemini-2.5-pro')
+
 
 class InvestigatorAgent(BaseAgent):
     """Agent responsible for expert fact-checking analysis"""
     
+    # Shared cap on in-flight Gemini requests to stay under the API rate limit
+    _GEMINI_SEM = asyncio.Semaphore(int(os.getenv("GEMINI_MAX_CONCURRENCY", "8")))
+    
     def __init__(self, agent_id: str = "investigator_agent_001", gemini_api_key: Optional[str] = None, supabase_client=None):
         super().__init__(agent_id, "InvestigatorAgent")
         self.gemini_api_key = gemini_api_key or os.getenv("GEMINI_API_KEY")
@@ -28,10 +206,7 @@ class InvestigatorAgent(BaseAgent):
         
         if self.use_gemini:
             try:
-                import google.generativeai as genai
-                genai.configure(api_key=self.gemini_api_key)
-                # Use a more stable model name
-                self.model = genai.GenerativeModel('gemini-2.5-pro')
+                self.model = _get_model(self.gemini_api_key)
                 logger.info(f"[{self.agent_name}] Gemini API configured successfully")
             except ImportError:
                 logger.warning(f"[{self.agent_name}] Google Generative AI library not installed, using mock implementation")
@@ -42,6 +217,24 @@ class InvestigatorAgent(BaseAgent):
         else:
             logger.info(f"[{self.agent_name}] No Gemini API key found, using mock implementation")
     
+    def extract_domain(self, source_url: str) -> str:
+        """
+        Extract the domain name from a source URL.
+        
+        Args:
+            source_url (str): The URL of the news source
+            
+        Returns:
+            str: The domain name, the full URL if it has no host, or "" for a missing URL
+        """
+        # Metadata can carry a null source_url; treat it like an empty one
+        source_url = source_url or ""
+        try:
+            return extract_host(source_url) or source_url
+        except Exception as e:
+            logger.warning(f"[{self.agent_name}] Error parsing URL '{source_url}': {e}")
+            return source_url  # Fallback to using the full URL
+    
     async def assess_source_credibility(self, source_name: str, source_url: str) -> float:
         """
         Assess the credibility of a news source using the Gemini model.
@@ -53,32 +246,33 @@ class InvestigatorAgent(BaseAgent):
         Returns:
             float: A credibility score between 0.0 (very unreliable) and 1.0 (very reliable)
         """
+        # Extract domain name from URL
+        domain_name = self.extract_domain(source_url)
+        
+        # Well-known domains have an effectively constant answer, so skip the LLM call
+        prior_score = _domain_prior(domain_name)
+        if prior_score is not None:
+            logger.info(f"[{self.agent_name}] Known domain '{domain_name}' for source '{source_name}', using prior score {prior_score}")
+            return prior_score
+        
         # Handle case where Gemini is not available
         if not self.use_gemini:
             logger.warning(f"[{self.agent_name}] Gemini not available, returning default credibility score of 0.5")
             return 0.5
         
         try:
-            # Extract domain name from URL
-            domain_name = ""
-            try:
-                parsed_url = urllib.parse.urlparse(source_url)
-                domain_name = parsed_url.netloc or parsed_url.path
-            except Exception as e:
-                logger.warning(f"[{self.agent_name}] Error parsing URL '{source_url}': {e}")
-                domain_name = source_url  # Fallback to using the full URL
-            
             # Construct prompt for Gemini
             prompt = f"Please assess the general credibility of the news source named '{source_name}' often found at the domain '{domain_name}'. Consider factors like journalistic standards, reputation for accuracy, potential bias, and ownership. Provide a credibility score between 0.0 (very unreliable) and 1.0 (very reliable) and a brief justification. Respond ONLY with JSON like: {{\"score\": 0.X, \"justification\": \"Brief reason...\"}}"
             
             logger.info(f"[{self.agent_name}] Assessing credibility for source '{source_name}' at domain '{domain_name}'")
             
             # Send prompt to Gemini model
-            response = await self.model.generate_content_async(prompt)
+            async with type(self)._GEMINI_SEM:
+                response = await self.model.generate_content_async(prompt, generation_config=CREDIBILITY_GENERATION_CONFIG)
             
             # Parse the response
             try:
-                result = json.loads(response.text)
+                result = orjson.loads(response.text)
                 score = result.get("score")
                 justification = result.get("justification", "")
                 
@@ -90,7 +284,7 @@ class InvestigatorAgent(BaseAgent):
                     logger.warning(f"[{self.agent_name}] Invalid score '{score}' returned from Gemini for source '{source_name}', defaulting to 0.5")
                     return 0.5
                     
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.warning(f"[{self.agent_name}] Error parsing JSON response from Gemini for source '{source_name}': {e}, defaulting to 0.5")
                 return 0.5
                 
@@ -98,6 +292,87 @@ class InvestigatorAgent(BaseAgent):
             logger.error(f"[{self.agent_name}] Error during source credibility assessment for '{source_name}': {e}")
             return 0.5
     
+    async def assess_sources_credibility(self, sources: List[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """
+        Assess the credibility of several news sources with a single Gemini call.
+        
+        Args:
+            sources (List[Tuple[str, str]]): (source_name, source_url) pairs to assess
+            
+        Returns:
+            Dict[Tuple[str, str], float]: Credibility scores keyed by the (source_name, source_url)
+                pairs as given, defaulting to 0.5
+        """
+        # Deduplicate by (source name, domain): sources sharing a default name such as
+        # "Unknown Source", or outlets sharing a name across domains, are assessed separately
+        source_keys = {(source_name, source_url): (source_name, self.extract_domain(source_url))
+                       for source_name, source_url in sources}
+        key_scores = {key: 0.5 for key in source_keys.values()}
+        
+        def scores_by_source():
+            return {source: key_scores[key] for source, key in source_keys.items()}
+        
+        # Settle well-known domains from the prior table without asking Gemini
+        pending_keys = []
+        for source_name, domain_name in key_scores:
+            prior_score = _domain_prior(domain_name)
+            if prior_score is not None:
+                logger.info(f"[{self.agent_name}] Known domain '{domain_name}' for source '{source_name}', using prior score {prior_score}")
+                key_scores[(source_name, domain_name)] = prior_score
+            else:
+                pending_keys.append((source_name, domain_name))
+        
+        if not pending_keys:
+            return scores_by_source()
+        
+        # Handle case where Gemini is not available
+        if not self.use_gemini:
+            logger.warning(f"[{self.agent_name}] Gemini not available, returning default credibility score of 0.5 for {len(pending_keys)} sources")
+            return scores_by_source()
+        
+        # A single source doesn't need the batch prompt
+        if len(pending_keys) == 1:
+            source_name, domain_name = pending_keys[0]
+            key_scores[pending_keys[0]] = await self.assess_source_credibility(source_name, domain_name)
+            return scores_by_source()
+        
+        try:
+            source_list = [{"id": i, "source_name": name, "domain": domain} for i, (name, domain) in enumerate(pending_keys)]
+            
+            # Construct one prompt covering every source
+            prompt = f"Please assess the general credibility of each of the following news sources. Consider factors like journalistic standards, reputation for accuracy, potential bias, and ownership. For each source provide a credibility score between 0.0 (very unreliable) and 1.0 (very reliable) and a brief justification, echoing its id exactly. Respond ONLY with a JSON array like: [{{\"id\": 0, \"score\": 0.X, \"justification\": \"Brief reason...\"}}]\n\nSOURCES:\n{orjson.dumps(source_list).decode()}"
+            
+            logger.info(f"[{self.agent_name}] Assessing credibility for {len(source_list)} sources in one batch")
+            
+            # Send prompt to Gemini model
+            async with type(self)._GEMINI_SEM:
+                response = await self.model.generate_content_async(prompt, generation_config=BATCH_CREDIBILITY_GENERATION_CONFIG)
+            
+            # Parse the response
+            try:
+                results = orjson.loads(response.text)
+            except orjson.JSONDecodeError as e:
+                logger.warning(f"[{self.agent_name}] Error parsing batch JSON response from Gemini: {e}, defaulting to 0.5")
+                return scores_by_source()
+            
+            for result in results:
+                index = result.get("id")
+                score = result.get("score")
+                
+                # Validate the echoed id and the score
+                if (isinstance(index, int) and 0 <= index < len(pending_keys)
+                        and isinstance(score, (int, float)) and 0.0 <= score <= 1.0):
+                    key_scores[pending_keys[index]] = float(score)
+                    logger.info(f"[{self.agent_name}] Source credibility assessment for '{pending_keys[index][0]}' at '{pending_keys[index][1]}': score={score}, justification='{result.get('justification', '')}'")
+                else:
+                    logger.warning(f"[{self.agent_name}] Invalid batch entry from Gemini (id='{index}', score='{score}'), ignoring")
+            
+            return scores_by_source()
+                
+        except Exception as e:
+            logger.error(f"[{self.agent_name}] Error during batch source credibility assessment: {e}")
+            return scores_by_source()
+    
     async def analyze_with_gemini(self, case_file: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze a case file using the Gemini API.
@@ -112,24 +387,25 @@ class InvestigatorAgent(BaseAgent):
             raise RuntimeError("Gemini API not configured")
         
         try:
-            # Format the case file as JSON for the prompt
-            case_file_json = json.dumps(case_file, indent=2)
+            # Format the case file as compact JSON for the prompt (indentation only adds tokens)
+            case_file_json = orjson.dumps(case_file).decode()
             
             # Create the full prompt
-            prompt = f"{INVESTIGATOR_MANDATE}\n\nCASE FILE:\n{case_file_json}"
+            prompt = _PROMPT_HEAD + case_file_json
             
             logger.info(f"[{self.agent_name}] Sending case to Gemini for analysis")
             
             # Call the Gemini API
-            response = await self.model.generate_content_async(prompt)
+            async with type(self)._GEMINI_SEM:
+                response = await self.model.generate_content_async(prompt, generation_config=VERDICT_GENERATION_CONFIG)
             
             # Parse the JSON response
-            result = json.loads(response.text)
+            result = orjson.loads(response.text)
             
             logger.info(f"[{self.agent_name}] Gemini analysis completed successfully")
             return result
             
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"[{self.agent_name}] Error parsing Gemini response as JSON: {e}")
             raise ValueError(f"Invalid JSON response from Gemini: {e}")
         except Exception as e:
@@ -149,34 +425,19 @@ class InvestigatorAgent(BaseAgent):
         logger.info(f"[{self.agent_name}] Using mock analysis implementation")
         
         # Extract key information from case file
-        claim_text = case_file.get("claim_text", "")
         text_suspicion_score = case_file.get("text_suspicion_score", 0.5)
         source_credibility_score = case_file.get("source_credibility_score", 0.5)
-        research_dossier = case_file.get("research_dossier", {})
         
         logger.info(f"[{self.agent_name}] Scores - Text: {text_suspicion_score:.4f}, Source: {source_credibility_score:.4f}")
         
         # Simple mock logic based on scores
-        if text_suspicion_score > 0.8 and source_credibility_score < 0.3:
-            verdict = "False"
-            confidence = 0.9
-            reasoning = "High suspicion score and low source credibility indicate misinformation."
-        elif text_suspicion_score < 0.3 and source_credibility_score > 0.7:
-            verdict = "True"
-            confidence = 0.8
-            reasoning = "Low suspicion score and high source credibility suggest authentic information."
-        else:
-            verdict = "Misleading"
-            confidence = 0.6
-            reasoning = "Mixed indicators require further investigation for complete accuracy."
-        
-        result = {
-            "verdict": verdict,
-            "confidence": confidence,
-            "reasoning": reasoning
+        result = _fast_verdict(text_suspicion_score, source_credibility_score) or {
+            "verdict": "Misleading",
+            "confidence": 0.6,
+            "reasoning": "Mixed indicators require further investigation for complete accuracy."
         }
         
-        logger.info(f"[{self.agent_name}] Verdict: {verdict}, Confidence: {confidence:.2f}")
+        logger.info(f"[{self.agent_name}] Verdict: {result['verdict']}, Confidence: {result['confidence']:.2f}")
         return result
     
     def increment_retry_count(self, claim_id: int):
@@ -230,19 +491,28 @@ class InvestigatorAgent(BaseAgent):
         """
         logger.info(f"[{self.agent_name}] Processing investigation task {task.task_id}")
         
-        # Extract case file from payload
-        case_file_json = task.payload.get("case_file_json", "{}")
-        
-        try:
-            case_file = json.loads(case_file_json)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in case_file_json: {e}")
+        # In-process callers pass the case file dict directly; parse JSON only when it
+        # crossed a serialization boundary
+        case_file = task.payload.get("case_file")
+        if case_file is None:
+            case_file_json = task.payload.get("case_file_json", "{}")
+            
+            try:
+                case_file = orjson.loads(case_file_json)
+            except orjson.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON in case_file_json: {e}")
         
         # Extract claim_id for retry tracking
         claim_id = case_file.get("claim_id")
         
+        # Decisive scores settle the verdict without spending a Gemini call
+        fast_result = _fast_verdict(case_file.get("text_suspicion_score", 0.5), case_file.get("source_credibility_score", 0.5))
+        
         # Perform analysis using either Gemini or mock implementation
-        if self.use_gemini:
+        if fast_result and fast_result["confidence"] >= FAST_VERDICT_MIN_CONFIDENCE:
+            logger.info(f"[{self.agent_name}] Scores are decisive, skipping Gemini (verdict: {fast_result['verdict']})")
+            result = fast_result
+        elif self.use_gemini:
             try:
                 result = await self.analyze_with_gemini(case_file)
             except Exception as e:
@@ -5,6 +5,9 @@ Gathers evidence from Wikipedia and web search results
 
 import wikipedia
 from googlesearch import search
+import asyncio
+import httpx
+import os
 import re
 import logging
 from typing import Dict, Any, List
@@ -21,6 +24,9 @@ class ResearchAgent(BaseAgent):
     
     def __init__(self, agent_id: str = "research_agent_001"):
         super().__init__(agent_id, "ResearchAgent")
+        # Google Custom Search JSON API credentials (falls back to googlesearch scraping if unset)
+        self.search_api_key = os.getenv("GOOGLE_SEARCH_API_KEY")
+        self.search_engine_id = os.getenv("GOOGLE_SEARCH_ENGINE_ID")
         
     def extract_search_terms(self, claim_text: str) -> List[str]:
         """
@@ -50,6 +56,39 @@ class ResearchAgent(BaseAgent):
         logger.info(f"[{self.agent_name}] Extracted {len(result)} search terms: {result[:5]}")
         return result
     
+    async def web_search(self, claim_text: str, num_results: int = 3) -> List[str]:
+        """
+        Search the web for a claim without blocking the event loop.
+        
+        Uses a single Google Custom Search JSON API request when credentials are
+        configured, otherwise runs the googlesearch scraper in a worker thread.
+        
+        Args:
+            claim_text (str): The claim to search for
+            num_results (int): Maximum number of results to return
+            
+        Returns:
+            List[str]: Result snippets with their URLs, or bare URLs from the scraper
+        """
+        if not (self.search_api_key and self.search_engine_id):
+            # The googlesearch library returns URLs, not snippets, and sleeps between requests
+            return await asyncio.to_thread(lambda: list(search(claim_text, num_results=num_results, sleep_interval=1)))
+        
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get(
+                "https://www.googleapis.com/customsearch/v1",
+                params={
+                    "key": self.search_api_key,
+                    "cx": self.search_engine_id,
+                    "q": claim_text,
+                    "num": num_results
+                }
+            )
+            response.raise_for_status()
+            items = response.json().get("items", [])
+        
+        return [f"{item.get('snippet', '')} ({item.get('link', '')})" for item in items[:num_results]]
+    
     async def gather_evidence(self, claim_text: str) -> Dict[str, Any]:
         """
         Gather evidence from Wikipedia and web search results for a given claim.
@@ -114,11 +153,8 @@ class ResearchAgent(BaseAgent):
         web_snippets = []
         try:
             logger.info(f"[{self.agent_name}] Starting web search for: {claim_text}")
-            # Use the googlesearch library to find search results
-            # Note: The googlesearch library returns URLs, not snippets
-            # It may return empty results due to IP restrictions or rate limiting
-            search_results = list(search(claim_text, num_results=3, sleep_interval=1))
-            web_snippets = search_results
+            # Note: The googlesearch fallback may return empty results due to IP restrictions or rate limiting
+            web_snippets = await self.web_search(claim_text, num_results=3)
             logger.info(f"[{self.agent_name}] Web search returned {len(web_snippets)} results")
         except Exception as e:
             # If the search fails, return an empty list
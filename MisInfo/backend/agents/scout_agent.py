@@ -2,14 +2,241 @@ import asyncio
 import json
 import logging
 import os
+import random
+import time
+from itertools import islice
 from typing import List, Dict, Any, Optional, Set
 import httpx
+import orjson
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
 from .base_agent import BaseAgent, AgentTask, AgentStatus, TaskPriority
+from .url_utils import extract_host
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Total limit of claims found per discovery cycle
+MAX_CLAIMS_PER_CYCLE = 15
+
+# Articles examined per query: a query can add at most MAX_CLAIMS_PER_CYCLE claims, so
+# oversample 3x to leave room for duplicates and filtered-out articles
+MAX_ARTICLES_PER_QUERY = MAX_CLAIMS_PER_CYCLE * 3
+
+# Cap on in-flight requests to each news provider
+MAX_CONCURRENT_REQUESTS_PER_PROVIDER = 5
+
+# Search queries per provider. Hot topics (breaking news, elections) are re-polled every
+# minute; broad background searches every ten minutes.
+NEWSDATA_HOT_QUERIES = (
+    "election fraud OR stolen election",
+    "breaking news OR urgent alert"
+)
+NEWSDATA_COLD_QUERIES = (
+    "conspiracy OR hoax OR fake news",
+    "vaccine microchip OR vaccine tracking",
+    "climate change hoax OR climate conspiracy",
+    "miracle cure OR secret cure OR doctors hate"
+)
+# The Guardian might need simpler keywords
+GUARDIAN_HOT_QUERIES = (
+    "election",
+    "breaking news"
+)
+GUARDIAN_COLD_QUERIES = (
+    "conspiracy",
+    "hoax",
+    "fake news",
+    "vaccine",
+    "climate change",
+    "miracle cure"
+)
+HOT_QUERY_INTERVAL_SECONDS = 60
+COLD_QUERY_INTERVAL_SECONDS = 600
+
+# Redis key prefix marking a query as recently polled by any scout worker
+REDIS_QUERY_POLL_PREFIX = "aegis:scout_poll:"
+
+# Transient provider failures worth retrying, and the backoff applied between attempts
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+MAX_FETCH_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+RETRY_MAX_DELAY_SECONDS = 10.0
+
+# How far above its documented rate a provider's bucket may speed up when its
+# X-RateLimit headers report spare quota
+ADAPTIVE_RATE_MAX_MULTIPLIER = 3
+
+# Longest a provider's bucket may be paused in one go, whatever its rate-limit headers say
+RATE_LIMIT_MAX_PAUSE_SECONDS = 300
+
+# Redis SET holding every claim URL already stored in raw_claims
+REDIS_CLAIM_URLS_KEY = "aegis:claim_urls"
+
+# Most members sent in one SADD, so seeding the store from a large table stays bounded per command
+REDIS_SADD_CHUNK_SIZE = 1000
+
+# Query parameters that only track the referrer and never change the article
+TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+# Near-duplicate claim text detection (MinHash over character shingles)
+NEAR_DUPLICATE_THRESHOLD = 0.85
+MINHASH_NUM_PERM = 64
+SHINGLE_SIZE = 5
+
+# Suspicious keywords that indicate potential misinformation
+SUSPICIOUS_KEYWORDS = frozenset({
+    "miracle cure", "doctors hate", "secret", "they don't want you to know",
+    "conspiracy", "hoax", "fake", "exposed", "truth revealed", "shocking",
+    "banned", "censored", "cover up", "hidden", "suppressed",
+    "cure cancer", "cure all", "100% effective", "guaranteed",
+    "big pharma", "mainstream media lies", "wake up", "sheeple",
+    "breaking", "urgent", "alert", "warning", "must read"
+})
+
+# Domains known for posting misinformation
+UNRELIABLE_DOMAINS = frozenset({
+    'infowars.com', 'naturalnews.com', 'dailywire.com', 'breitbart.com',
+    'theonion.com', 'empirenews.net', 'nationalreport.net', 'newsmutiny.com',
+    'duffelblog.com', 'clickhole.com', 'borowitzreport.com', 'chicksonright.com',
+    'conservativetribune.com', 'dcclothesline.com', 'godlikeproductions.com',
+    'govtslaves.info', 'iceagenow.info', 'lewrockwell.com', 'libertymovementradio.com',
+    'libertytalk.fm', 'prisonplanet.com', 'rawstory.com', 'redflagnews.com',
+    'rense.com', 'rumormillnews.com', 'sott.net', 'thedailysheeple.com',
+    'theforbiddenknowledge.com', 'truthfrequencyradio.com', 'wakingupwisconsin.com',
+    'whatreallyhappened.com', 'worldtruth.tv', 'zerohedge.com', 'activistpost.com',
+    'beforeitsnews.com', 'bients.com', 'collective-evolution.com', 'consciouslifenews.com',
+    'davidwolfe.com', 'endtimeheadlines.org', 'globalresearch.ca', 'govtslaves.com',
+    'healthimpactnews.com', 'healthnutnews.com', 'in5d.com', 'infiniteunknown.net',
+    'informationclearinghouse.info', 'intellihub.com', 'investmentwatchblog.com',
+    'jonesreport.com', 'kingworldnews.com', 'naturalblaze.com', 'naturalnewsblogs.com',
+    'neonnettle.com', 'newstarget.com', 'nowtheendbegins.com', 'oilgeopolitics.net',
+    'presstv.com', 'prisonplanet.tv', 'realjewnews.com', 'redstate.com',
+    'rt.com', 'shtfplan.com', 'silverdoctors.com', 'silverstealers.net',
+    'sonsoflibertyradio.com', 'thedailymash.co.uk', 'thefreethoughtproject.com',
+    'thelibertybeacon.com', 'themindunleashed.com', 'truthdig.com', 'truthwiki.org',
+    'ufoholic.com', 'unz.com', 'veteranstoday.com', 'washingtonsblog.com',
+    'wearechange.org', 'whatdoesitmean.com', 'whowhatwhy.org', 'wikispooks.com',
+    'worldnewspolitics.com', 'yournewswire.com', 'zengardner.com'
+})
+
+# Source names treated as reputable when filtering Newsdata.io articles
+REPUTABLE_SOURCE_NAMES = ("Reuters", "Associated Press", "BBC News", "NPR", "The Guardian", "CNN", "BBC")
+
+
+class AsyncTokenBucket:
+    """Token bucket that spaces out requests only as much as a provider's rate limit requires"""
+    
+    def __init__(self, rate: float, capacity: int = 1, max_rate: Optional[float] = None):
+        """
+        Args:
+            rate (float): Tokens added per second (sustained requests per second)
+            capacity (int): Maximum burst size
+            max_rate (Optional[float]): Upper bound for adjust_rate, defaults to rate
+        """
+        self.rate = rate
+        self.min_rate = rate / 10
+        self.max_rate = max_rate or rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+    
+    def adjust_rate(self, rate: float):
+        """Change the refill rate, clamped to [rate / 10 of the initial rate, max_rate]"""
+        self.rate = min(self.max_rate, max(self.min_rate, rate))
+    
+    def pause(self, seconds: float):
+        """Hand out no tokens for the given number of seconds (e.g. after a 429), at most RATE_LIMIT_MAX_PAUSE_SECONDS"""
+        seconds = min(max(seconds, 0.0), RATE_LIMIT_MAX_PAUSE_SECONDS)
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+    
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize an article URL so provider-specific variants map to one duplicate-check key.
+    
+    Lowercases the scheme and host, drops "www.", any userinfo and port, tracking parameters,
+    the fragment and any trailing slash.
+    
+    Args:
+        url (str): The article URL
+        
+    Returns:
+        str: The canonical URL, or the input unchanged if it cannot be parsed
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    host = extract_host(parts.netloc)
+    if host.startswith("www."):
+        host = host[4:]
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if not key.lower().startswith(TRACKING_PARAM_PREFIXES)]
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip("/") or "/", urlencode(query), ""))
+
+
+def _claim_minhash(claim_text: str):
+    """Build a MinHash signature from the character shingles of the whitespace-normalized claim text"""
+    text = " ".join(claim_text.lower().split())
+    shingles = {text[i:i + SHINGLE_SIZE] for i in range(max(len(text) - SHINGLE_SIZE + 1, 1))}
+    signature = MinHash(num_perm=MINHASH_NUM_PERM)
+    signature.update_batch([shingle.encode("utf-8") for shingle in shingles])
+    return signature
+
+
+def _build_automaton(patterns):
+    """Build an Aho-Corasick automaton over the lowercased patterns, or None if pyahocorasick is missing"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in patterns:
+        automaton.add_word(pattern.lower(), pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+def _contains_any(automaton, patterns, text: str) -> bool:
+    """Return True if any pattern occurs in text, in a single pass when an automaton is available"""
+    if automaton is not None:
+        return next(automaton.iter(text), None) is not None
+    return any(pattern in text for pattern in patterns)
+
+
+# Multi-pattern automaton so each claim is scanned once regardless of keyword count
+_KEYWORD_AUTOMATON = _build_automaton(SUSPICIOUS_KEYWORDS)
+
 
 class ScoutAgent(BaseAgent):
     """Agent responsible for discovering new claims"""
@@ -31,42 +258,63 @@ class ScoutAgent(BaseAgent):
         else:
             logger.info(f"[{self.agent_name}] GUARDIAN_API_KEY: ✗")
         
-        # Suspicious keywords that indicate potential misinformation
-        self.suspicious_keywords = [
-            "miracle cure", "doctors hate", "secret", "they don't want you to know",
-            "conspiracy", "hoax", "fake", "exposed", "truth revealed", "shocking",
-            "banned", "censored", "cover up", "hidden", "suppressed",
-            "cure cancer", "cure all", "100% effective", "guaranteed",
-            "big pharma", "mainstream media lies", "wake up", "sheeple",
-            "breaking", "urgent", "alert", "warning", "must read"
-        ]
-        
-        # Domains known for posting misinformation
-        self.unreliable_domains = [
-            'infowars.com', 'naturalnews.com', 'dailywire.com', 'breitbart.com',
-            'theonion.com', 'empirenews.net', 'nationalreport.net', 'newsmutiny.com',
-            'duffelblog.com', 'clickhole.com', 'borowitzreport.com', 'chicksonright.com',
-            'conservativetribune.com', 'dcclothesline.com', 'godlikeproductions.com',
-            'govtslaves.info', 'iceagenow.info', 'lewrockwell.com', 'libertymovementradio.com',
-            'libertytalk.fm', 'prisonplanet.com', 'rawstory.com', 'redflagnews.com',
-            'rense.com', 'rumormillnews.com', 'sott.net', 'thedailysheeple.com',
-            'theforbiddenknowledge.com', 'truthfrequencyradio.com', 'wakingupwisconsin.com',
-            'whatreallyhappened.com', 'worldtruth.tv', 'zerohedge.com', 'activistpost.com',
-            'beforeitsnews.com', 'bients.com', 'collective-evolution.com', 'consciouslifenews.com',
-            'davidwolfe.com', 'endtimeheadlines.org', 'globalresearch.ca', 'govtslaves.com',
-            'healthimpactnews.com', 'healthnutnews.com', 'in5d.com', 'infiniteunknown.net',
-            'informationclearinghouse.info', 'intellihub.com', 'investmentwatchblog.com',
-            'jonesreport.com', 'kingworldnews.com', 'naturalblaze.com', 'naturalnewsblogs.com',
-            'neonnettle.com', 'newstarget.com', 'nowtheendbegins.com', 'oilgeopolitics.net',
-            'presstv.com', 'prisonplanet.tv', 'realjewnews.com', 'redstate.com',
-            'rt.com', 'shtfplan.com', 'silverdoctors.com', 'silverstealers.net',
-            'sonsoflibertyradio.com', 'thedailymash.co.uk', 'thefreethoughtproject.com',
-            'thelibertybeacon.com', 'themindunleashed.com', 'truthdig.com', 'truthwiki.org',
-            'ufoholic.com', 'unz.com', 'veteranstoday.com', 'washingtonsblog.com',
-            'wearechange.org', 'whatdoesitmean.com', 'whowhatwhy.org', 'wikispooks.com',
-            'worldnewspolitics.com', 'yournewswire.com', 'zengardner.com', 'zerohedge.com'
-        ]
+        # Per-provider rate limiters (about 1 request/s for Newsdata.io, one per 1.1 s for The Guardian),
+        # retuned from each response's rate-limit headers
+        self.newsdata_bucket = AsyncTokenBucket(rate=1.0, capacity=1, max_rate=1.0 * ADAPTIVE_RATE_MAX_MULTIPLIER)
+        self.guardian_bucket = AsyncTokenBucket(rate=1 / 1.1, capacity=1, max_rate=ADAPTIVE_RATE_MAX_MULTIPLIER / 1.1)
+        
+        # Shared HTTP client, opened lazily by start()
+        self._client = None
+        
+        # Next time each (provider, query) may be polled, used when Redis is not configured
+        self._query_next_poll = {}
         
+        # Optional Redis SET shared by all scout workers for URL deduplication
+        self.redis_client = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url:
+            try:
+                import redis.asyncio as aioredis
+                self.redis_client = aioredis.from_url(redis_url, decode_responses=True)
+                logger.info(f"[{self.agent_name}] Redis claim URL store configured")
+            except ImportError:
+                logger.warning(f"[{self.agent_name}] redis library not installed, using in-process duplicate checking")
+            except Exception as e:
+                logger.error(f"[{self.agent_name}] Error configuring Redis: {e}")
+        
+        # LSH index over the text of stored claims, catching reprints published under other URLs
+        self._claim_lsh = None
+        if DATASKETCH_AVAILABLE:
+            self._claim_lsh = MinHashLSH(threshold=NEAR_DUPLICATE_THRESHOLD, num_perm=MINHASH_NUM_PERM)
+        else:
+            logger.info(f"[{self.agent_name}] datasketch not installed, near-duplicate claim detection disabled")
+        
+        if not AHOCORASICK_AVAILABLE:
+            logger.info(f"[{self.agent_name}] pyahocorasick not installed, using substring scans for keyword checks")
+        
+    async def start(self) -> httpx.AsyncClient:
+        """
+        Open the shared HTTP client (once) so TLS sessions and pooled connections survive across tasks.
+        
+        Returns:
+            httpx.AsyncClient: The shared client
+        """
+        if self._client is None or self._client.is_closed:
+            limits = httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=300)
+            try:
+                self._client = httpx.AsyncClient(http2=True, timeout=10.0, limits=limits)
+            except ImportError:
+                # HTTP/2 needs the optional h2 package
+                logger.info(f"[{self.agent_name}] h2 not installed, using HTTP/1.1 client")
+                self._client = httpx.AsyncClient(timeout=10.0, limits=limits)
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
         """
         Process a task to discover new claims from real news sources.
@@ -106,204 +354,50 @@ class ScoutAgent(BaseAgent):
             newsdata_api_key = os.getenv("NEWSDATA_API_KEY")
             guardian_api_key = os.getenv("GUARDIAN_API_KEY")
             
-            # Search for controversial/fact-checkable topics with suspicious keywords
-            search_queries = [
-                "conspiracy OR hoax OR fake news",
-                "vaccine microchip OR vaccine tracking",
-                "climate change hoax OR climate conspiracy",
-                "election fraud OR stolen election",
-                "miracle cure OR secret cure OR doctors hate",
-                "breaking news OR urgent alert"
-            ]
-            
             if newsdata_api_key or guardian_api_key:
                 # Use async httpx client for non-blocking I/O
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    # Removed NewsAPI.org integration section
-                    
-                    # Fetch from Newsdata.io if key is available
-                    if newsdata_api_key:
-                        logger.info(f"[{self.agent_name}] Starting Newsdata.io discovery")
-                        # Loop through every query in the search_queries list
-                        for query in search_queries:
-                            try:
-                                # Make request to Newsdata.io API
-                                response = await client.get(
-                                    "https://newsdata.io/api/1/news",
-                                    params={
-                                        "apikey": newsdata_api_key,
-                                        "q": query,
-                                        "language": "en"
-                                    }
-                                )
-                                
-                                # Add delay to respect rate limits
-                                await asyncio.sleep(1)
-                                
-                                if response.status_code == 200:
-                                    data = response.json()
-                                    articles = data.get("results", [])
-                                    logger.info(f"[{self.agent_name}] Newsdata.io - Found {len(articles)} articles for query: {query}")
-                                    
-                                    for article in articles:
-                                        title = article.get("title", "")
-                                        description = article.get("description", "")
-                                        url = article.get("link", "")
-                                        source_id = article.get("source_id", "Unknown")
-                                        creator = article.get("creator", ["Unknown"])
-                                        source_name = creator[0] if creator and isinstance(creator, list) and len(creator) > 0 else source_id
-                                        pub_date = article.get("pubDate", "")
-                                        
-                                        # Use title or description as claim
-                                        claim_text = title if title else description
-                                        
-                                        if not claim_text or len(claim_text) < 20:
-                                            continue
-                                        
-                                        # Check if URL already exists in database (persistent duplicate checking)
-                                        if url in existing_claim_urls:
-                                            logger.info(f"[{self.agent_name}] Skipping duplicate claim from Newsdata.io URL: {url}")
-                                            continue
-                                        
-                                        # Check for suspicious keywords
-                                        is_suspicious = any(keyword in claim_text.lower() for keyword in self.suspicious_keywords)
-                                        
-                                        # Filter out reputable sources reporting normally
-                                        reputable_sources = ["Reuters", "Associated Press", "BBC News", "NPR", "The Guardian", "CNN", "BBC"]
-                                        is_reputable = any(rep_source in source_name for rep_source in reputable_sources)
-                                        
-                                        # Check if source is from an unreliable domain
-                                        is_unreliable_domain = any(domain in url.lower() for domain in self.unreliable_domains)
-                                        
-                                        # Discover if: suspicious keywords OR unreliable domain OR (controversial topic AND not reputable source)
-                                        # Always discover a few claims even if not suspicious to ensure we have content
-                                        if is_suspicious or is_unreliable_domain or (len(discovered_claims) < 10 and not is_reputable) or len(discovered_claims) < 5:
-                                            logger.info(f"[{self.agent_name}] ✓ Discovering from Newsdata.io: {claim_text[:60]}... (suspicious={is_suspicious}, unreliable_domain={is_unreliable_domain}, source={source_name})")
-                                            discovered_claims.append({
-                                                "claim_text": claim_text[:200],  # Limit length
-                                                "source_metadata_json": json.dumps({
-                                                    "source_url": url,
-                                                    "source_name": source_name,
-                                                    "published_at": pub_date,
-                                                    "discovered_via": "Newsdata.io"
-                                                })
-                                            })
-                                            
-                                            # Increase the total limit of claims found per cycle
-                                            if len(discovered_claims) >= 15:
-                                                break
-                                else:
-                                    logger.warning(f"[{self.agent_name}] Newsdata.io API returned status code {response.status_code} for query: {query}")
-                                    
-                            except httpx.TimeoutException:
-                                logger.warning(f"[{self.agent_name}] Newsdata.io request timed out for query: {query}")
-                            except httpx.RequestError as e:
-                                logger.warning(f"[{self.agent_name}] Error fetching from Newsdata.io for query '{query}': {e}")
-                            except httpx.HTTPStatusError as e:
-                                logger.warning(f"[{self.agent_name}] HTTP error from Newsdata.io for query '{query}': {e}")
-                            except Exception as e:
-                                logger.warning(f"[{self.agent_name}] Unexpected error in Newsdata.io discovery for query '{query}': {e}")
-                                
-                            # If we've reached our limit, break out of the query loop as well
-                            if len(discovered_claims) >= 15:
-                                break
+                # Reuse the agent's pooled client across discovery cycles
+                client = await self.start()
+                # Removed NewsAPI.org integration section
+                
+                # Fire every query concurrently, capped per provider to respect rate limits
+                fetches = []
+                
+                # Fetch from Newsdata.io if key is available
+                if newsdata_api_key:
+                    # Only the queries whose polling interval has lapsed
+                    search_queries = await self._due_queries("newsdata", NEWSDATA_HOT_QUERIES, NEWSDATA_COLD_QUERIES)
+                    logger.info(f"[{self.agent_name}] Starting Newsdata.io discovery ({len(search_queries)} queries due)")
+                    newsdata_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_PROVIDER)
+                    fetches.extend(
+                        self._fetch_newsdata(client, newsdata_api_key, query, newsdata_sem, existing_claim_urls)
+                        for query in search_queries
+                    )
+                
+                # Fetch from The Guardian if key is available
+                if guardian_api_key:
+                    guardian_queries = await self._due_queries("guardian", GUARDIAN_HOT_QUERIES, GUARDIAN_COLD_QUERIES)
+                    logger.info(f"[{self.agent_name}] Starting The Guardian discovery ({len(guardian_queries)} queries due)")
+                    guardian_sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS_PER_PROVIDER)
+                    fetches.extend(
+                        self._fetch_guardian(client, guardian_api_key, query, guardian_sem, existing_claim_urls)
+                        for query in guardian_queries
+                    )
+                
+                results = await asyncio.gather(*fetches, return_exceptions=True)
+                
+                # Merge in query order (Newsdata.io first, then The Guardian, hot queries before cold)
+                # so the per-cycle cap and the "always discover a few" rule favor fresh topics
+                seen_urls = set()
+                for candidates in results:
+                    if isinstance(candidates, Exception):
+                        logger.warning(f"[{self.agent_name}] Unexpected error in discovery fetch: {candidates}")
+                        continue
+                    self._select_claims(candidates, discovered_claims, seen_urls)
                     
-                    # Fetch from The Guardian if key is available
-                    if guardian_api_key:
-                        logger.info(f"[{self.agent_name}] Starting The Guardian discovery")
-                        # Loop through every query in the search_queries list
-                        # The Guardian might need simpler keywords
-                        guardian_queries = [
-                            "conspiracy",
-                            "hoax",
-                            "fake news",
-                            "vaccine",
-                            "climate change",
-                            "election",
-                            "miracle cure",
-                            "breaking news"
-                        ]
-                        
-                        for query in guardian_queries:
-                            try:
-                                # Make request to The Guardian API
-                                response = await client.get(
-                                    "https://content.guardianapis.com/search",
-                                    params={
-                                        "api-key": guardian_api_key,
-                                        "q": query,
-                                        "show-fields": "headline,bodyText",
-                                        "order-by": "newest"
-                                    }
-                                )
-                                
-                                # Add delay to respect rate limits (1.1 seconds as per requirement)
-                                await asyncio.sleep(1.1)
-                                
-                                if response.status_code == 200:
-                                    data = response.json()
-                                    articles = data.get("response", {}).get("results", [])
-                                    logger.info(f"[{self.agent_name}] The Guardian - Found {len(articles)} articles for query: {query}")
-                                    
-                                    for article in articles:
-                                        headline = article.get("fields", {}).get("headline", "")
-                                        web_url = article.get("webUrl", "")
-                                        body_text = article.get("fields", {}).get("bodyText", "")
-                                        pub_date = article.get("webPublicationDate", "")
-                                        
-                                        # Use headline as claim
-                                        claim_text = headline
-                                        
-                                        if not claim_text or len(claim_text) < 20:
-                                            continue
-                                        
-                                        # Check if URL already exists in database (persistent duplicate checking)
-                                        if web_url in existing_claim_urls:
-                                            logger.info(f"[{self.agent_name}] Skipping duplicate claim from The Guardian URL: {web_url}")
-                                            continue
-                                        
-                                        # Check for suspicious keywords
-                                        is_suspicious = any(keyword in claim_text.lower() for keyword in self.suspicious_keywords)
-                                        
-                                        # Filter out reputable sources reporting normally
-                                        # The Guardian is a reputable source, so we'll set is_reputable to True
-                                        is_reputable = True
-                                        
-                                        # Check if source is from an unreliable domain (shouldn't be for The Guardian)
-                                        is_unreliable_domain = any(domain in web_url.lower() for domain in self.unreliable_domains)
-                                        
-                                        # Discover if: suspicious keywords OR unreliable domain OR (controversial topic AND not reputable source)
-                                        # Always discover a few claims even if not suspicious to ensure we have content
-                                        if is_suspicious or is_unreliable_domain or (len(discovered_claims) < 10 and not is_reputable) or len(discovered_claims) < 5:
-                                            logger.info(f"[{self.agent_name}] ✓ Discovering from The Guardian: {claim_text[:60]}... (suspicious={is_suspicious}, unreliable_domain={is_unreliable_domain})")
-                                            discovered_claims.append({
-                                                "claim_text": claim_text[:200],  # Limit length
-                                                "source_metadata_json": json.dumps({
-                                                    "source_url": web_url,
-                                                    "source_name": "The Guardian",
-                                                    "published_at": pub_date,
-                                                    "discovered_via": "The Guardian"
-                                                })
-                                            })
-                                            
-                                            # Increase the total limit of claims found per cycle
-                                            if len(discovered_claims) >= 15:
-                                                break
-                                else:
-                                    logger.warning(f"[{self.agent_name}] The Guardian API returned status code {response.status_code} for query: {query}")
-                                    
-                            except httpx.TimeoutException:
-                                logger.warning(f"[{self.agent_name}] The Guardian request timed out for query: {query}")
-                            except httpx.RequestError as e:
-                                logger.warning(f"[{self.agent_name}] Error fetching from The Guardian for query '{query}': {e}")
-                            except httpx.HTTPStatusError as e:
-                                logger.warning(f"[{self.agent_name}] HTTP error from The Guardian for query '{query}': {e}")
-                            except Exception as e:
-                                logger.warning(f"[{self.agent_name}] Unexpected error in The Guardian discovery for query '{query}': {e}")
-                                
-                            # If we've reached our limit, break out of the query loop as well
-                            if len(discovered_claims) >= 15:
-                                break
+                    # If we've reached our limit, stop merging
+                    if len(discovered_claims) >= MAX_CLAIMS_PER_CYCLE:
+                        break
                                 
             else:
                 logger.warning(f"[{self.agent_name}] No API keys configured (NEWSDATA_API_KEY or GUARDIAN_API_KEY)")
@@ -318,6 +412,473 @@ class ScoutAgent(BaseAgent):
             "claims": discovered_claims,
             "discovery_timestamp": task.created_at.isoformat()
         }
+    
+    async def _fetch_newsdata(self, client: httpx.AsyncClient, api_key: str, query: str,
+                              sem: asyncio.Semaphore, existing_claim_urls: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch one Newsdata.io query and return its candidate claims.
+        
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client
+            api_key (str): The Newsdata.io API key
+            query (str): The search query
+            sem (asyncio.Semaphore): Caps concurrent Newsdata.io requests
+            existing_claim_urls (Set[str]): URLs already in the database
+            
+        Returns:
+            List[Dict[str, Any]]: Candidate claims, not yet filtered by the per-cycle cap
+        """
+        candidates = []
+        async with sem:
+            try:
+                # Make request to Newsdata.io API
+                data = await self._get_json(
+                    client,
+                    "Newsdata.io",
+                    "https://newsdata.io/api/1/news",
+                    params={
+                        "apikey": api_key,
+                        "q": query,
+                        "language": "en"
+                    },
+                    query=query,
+                    bucket=self.newsdata_bucket
+                )
+                
+                if data is not None:
+                    articles = list(islice(data.get("results", []), MAX_ARTICLES_PER_QUERY))
+                    
+                    # Look up every URL in this response at once (persistent duplicate checking)
+                    known_urls = await self._find_known_urls([article.get("link", "") for article in articles], existing_claim_urls)
+                    logger.info("[%s] Newsdata.io - Found %d articles (%d already stored) for query: %s",
+                                self.agent_name, len(articles), len(known_urls), query)
+                    
+                    for article in articles:
+                        title = article.get("title", "")
+                        description = article.get("description", "")
+                        url = article.get("link", "")
+                        source_id = article.get("source_id", "Unknown")
+                        creator = article.get("creator", ["Unknown"])
+                        source_name = creator[0] if creator and isinstance(creator, list) and len(creator) > 0 else source_id
+                        pub_date = article.get("pubDate", "")
+                        
+                        # Use title or description as claim
+                        claim_text = title if title else description
+                        
+                        if not claim_text or len(claim_text) < 20:
+                            continue
+                        
+                        # Check if URL already exists in database (persistent duplicate checking)
+                        if url in known_urls:
+                            logger.debug("[%s] Skipping duplicate claim from Newsdata.io URL: %s", self.agent_name, url)
+                            continue
+                        
+                        # Lowercase once per article and reuse for every text check
+                        lowered_text = claim_text.lower()
+                        
+                        # Check for suspicious keywords
+                        is_suspicious = self._has_suspicious_keyword(lowered_text)
+                        
+                        # Filter out reputable sources reporting normally
+                        is_reputable = any(rep_source in source_name for rep_source in REPUTABLE_SOURCE_NAMES)
+                        
+                        # Check if source is from an unreliable domain
+                        is_unreliable_domain = self._is_unreliable(url)
+                        
+                        candidates.append({
+                            "claim_text": claim_text,
+                            "source_url": url,
+                            "source_name": source_name,
+                            "published_at": pub_date,
+                            "discovered_via": "Newsdata.io",
+                            "is_suspicious": is_suspicious,
+                            "is_reputable": is_reputable,
+                            "is_unreliable_domain": is_unreliable_domain
+                        })
+                    
+            except httpx.TimeoutException:
+                logger.warning(f"[{self.agent_name}] Newsdata.io request timed out for query: {query}")
+            except httpx.RequestError as e:
+                logger.warning(f"[{self.agent_name}] Error fetching from Newsdata.io for query '{query}': {e}")
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"[{self.agent_name}] HTTP error from Newsdata.io for query '{query}': {e}")
+            except Exception as e:
+                logger.warning(f"[{self.agent_name}] Unexpected error in Newsdata.io discovery for query '{query}': {e}")
+        
+        return candidates
+    
+    async def _fetch_guardian(self, client: httpx.AsyncClient, api_key: str, query: str,
+                              sem: asyncio.Semaphore, existing_claim_urls: Set[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch one The Guardian query and return its candidate claims.
+        
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client
+            api_key (str): The Guardian API key
+            query (str): The search query
+            sem (asyncio.Semaphore): Caps concurrent The Guardian requests
+            existing_claim_urls (Set[str]): URLs already in the database
+            
+        Returns:
+            List[Dict[str, Any]]: Candidate claims, not yet filtered by the per-cycle cap
+        """
+        candidates = []
+        async with sem:
+            try:
+                # Make request to The Guardian API
+                data = await self._get_json(
+                    client,
+                    "The Guardian",
+                    "https://content.guardianapis.com/search",
+                    params={
+                        "api-key": api_key,
+                        "q": query,
+                        "show-fields": "headline",  # Only the headline is used as the claim
+                        "order-by": "newest"
+                    },
+                    query=query,
+                    bucket=self.guardian_bucket
+                )
+                
+                if data is not None:
+                    articles = list(islice(data.get("response", {}).get("results", []), MAX_ARTICLES_PER_QUERY))
+                    
+                    # Look up every URL in this response at once (persistent duplicate checking)
+                    known_urls = await self._find_known_urls([article.get("webUrl", "") for article in articles], existing_claim_urls)
+                    logger.info("[%s] The Guardian - Found %d articles (%d already stored) for query: %s",
+                                self.agent_name, len(articles), len(known_urls), query)
+                    
+                    for article in articles:
+                        headline = article.get("fields", {}).get("headline", "")
+                        web_url = article.get("webUrl", "")
+                        pub_date = article.get("webPublicationDate", "")
+                        
+                        # Use headline as claim
+                        claim_text = headline
+                        
+                        if not claim_text or len(claim_text) < 20:
+                            continue
+                        
+                        # Check if URL already exists in database (persistent duplicate checking)
+                        if web_url in known_urls:
+                            logger.debug("[%s] Skipping duplicate claim from The Guardian URL: %s", self.agent_name, web_url)
+                            continue
+                        
+                        # Lowercase once per article and reuse for every text check
+                        lowered_text = claim_text.lower()
+                        
+                        # Check for suspicious keywords
+                        is_suspicious = self._has_suspicious_keyword(lowered_text)
+                        
+                        # Filter out reputable sources reporting normally
+                        # The Guardian is a reputable source, so we'll set is_reputable to True
+                        is_reputable = True
+                        
+                        # Check if source is from an unreliable domain (shouldn't be for The Guardian)
+                        is_unreliable_domain = self._is_unreliable(web_url)
+                        
+                        candidates.append({
+                            "claim_text": claim_text,
+                            "source_url": web_url,
+                            "source_name": "The Guardian",
+                            "published_at": pub_date,
+                            "discovered_via": "The Guardian",
+                            "is_suspicious": is_suspicious,
+                            "is_reputable": is_reputable,
+                            "is_unreliable_domain": is_unreliable_domain
+                        })
+                    
+            except httpx.TimeoutException:
+                logger.warning(f"[{self.agent_name}] The Guardian request timed out for query: {query}")
+            except httpx.RequestError as e:
+                logger.warning(f"[{self.agent_name}] Error fetching from The Guardian for query '{query}': {e}")
+            except httpx.HTTPStatusError as e:
+                logger.warning(f"[{self.agent_name}] HTTP error from The Guardian for query '{query}': {e}")
+            except Exception as e:
+                logger.warning(f"[{self.agent_name}] Unexpected error in The Guardian discovery for query '{query}': {e}")
+        
+        return candidates
+    
+    async def _due_queries(self, provider: str, hot_queries, cold_queries) -> List[str]:
+        """
+        Pick the provider's queries whose polling interval has lapsed and mark them as polled.
+        
+        With Redis configured, each query is claimed with SET NX EX so only one scout worker
+        polls it per interval.
+        
+        Args:
+            provider (str): Provider name
+            hot_queries: Queries polled every HOT_QUERY_INTERVAL_SECONDS
+            cold_queries: Queries polled every COLD_QUERY_INTERVAL_SECONDS
+            
+        Returns:
+            List[str]: The due queries, hot ones first
+        """
+        schedule = [(query, HOT_QUERY_INTERVAL_SECONDS) for query in hot_queries]
+        schedule += [(query, COLD_QUERY_INTERVAL_SECONDS) for query in cold_queries]
+        
+        if self.redis_client is not None:
+            try:
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for query, interval in schedule:
+                        pipe.set(f"{REDIS_QUERY_POLL_PREFIX}{provider}:{query}", 1, nx=True, ex=interval)
+                    claimed = await pipe.execute()
+                return [query for (query, _), is_claimed in zip(schedule, claimed) if is_claimed]
+            except Exception as e:
+                logger.warning(f"[{self.agent_name}] Error claiming queries in Redis, using local schedule: {e}")
+        
+        now = time.monotonic()
+        due = []
+        for query, interval in schedule:
+            if self._query_next_poll.get((provider, query), 0.0) <= now:
+                self._query_next_poll[(provider, query)] = now + interval
+                due.append(query)
+        return due
+    
+    async def _get_json(self, client: httpx.AsyncClient, provider: str, url: str, params: Dict[str, Any],
+                        query: str, bucket: AsyncTokenBucket) -> Optional[Dict[str, Any]]:
+        """
+        GET a provider endpoint and return its parsed JSON.
+        
+        No response cache is kept: _due_queries already spaces repeats of a query by at least
+        HOT_QUERY_INTERVAL_SECONDS, so a cached response would always have expired.
+        
+        Args:
+            client (httpx.AsyncClient): The shared HTTP client
+            provider (str): Provider name, used in logs
+            url (str): The endpoint URL
+            params (Dict[str, Any]): Query parameters
+            query (str): The search query, used in logs
+            bucket (AsyncTokenBucket): The provider's rate limiter
+            
+        Returns:
+            Optional[Dict[str, Any]]: The parsed response, or None on a non-200 status
+        """
+        for attempt in range(1, MAX_FETCH_ATTEMPTS + 1):
+            # Wait only as long as the provider's rate limit requires
+            await bucket.acquire()
+            response = await client.get(url, params=params)
+            self._adapt_rate(bucket, response)
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_FETCH_ATTEMPTS:
+                break
+            
+            delay = self._retry_delay(response, attempt)
+            logger.info(f"[{self.agent_name}] {provider} API returned status code {response.status_code}, "
+                        f"retrying in {delay:.1f}s (attempt {attempt}/{MAX_FETCH_ATTEMPTS})")
+            if response.status_code == 429:
+                # Rate limited: hold every request to this provider, not just this one
+                bucket.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+        
+        if response.status_code != 200:
+            logger.warning(f"[{self.agent_name}] {provider} API returned status code {response.status_code} for query: {query}")
+            return None
+        
+        return orjson.loads(response.content)
+    
+    @staticmethod
+    def _adapt_rate(bucket: AsyncTokenBucket, response: httpx.Response):
+        """
+        Spread the provider's remaining quota evenly over its reset window.
+        
+        Only applies when the response carries X-RateLimit-Remaining and X-RateLimit-Reset;
+        otherwise the bucket keeps its current rate. The reset may be given either as seconds
+        until the window resets or as a Unix timestamp.
+        
+        Args:
+            bucket (AsyncTokenBucket): The provider's rate limiter
+            response (httpx.Response): The provider response
+        """
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining, reset = int(remaining), float(reset)
+        except ValueError:
+            return
+        now = time.time()
+        if reset > now / 2:
+            # Far too large to be a delay, so it is an epoch timestamp
+            reset -= now
+        if remaining <= 0:
+            bucket.pause(reset)
+        elif reset > 0:
+            bucket.adjust_rate(remaining / reset)
+    
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> float:
+        """
+        Work out how long to wait before retrying a failed request.
+        
+        Honors a numeric Retry-After header when the provider sends one, otherwise uses
+        exponential backoff with full jitter.
+        
+        Args:
+            response (httpx.Response): The failed response
+            attempt (int): The attempt that just failed, starting at 1
+            
+        Returns:
+            float: Seconds to wait
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(float(retry_after), RETRY_MAX_DELAY_SECONDS)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        return random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1)))
+    
+    async def has_shared_url_store(self) -> bool:
+        """Check whether the Redis claim URL store is configured and already populated"""
+        if self.redis_client is None:
+            return False
+        try:
+            return bool(await self.redis_client.exists(REDIS_CLAIM_URLS_KEY))
+        except Exception as e:
+            logger.warning(f"[{self.agent_name}] Error checking Redis claim URL store: {e}")
+            return False
+    
+    async def remember_claim_urls(self, urls):
+        """
+        Record claim URLs (canonicalized) in the shared Redis store so later cycles and other workers skip them.
+        
+        Args:
+            urls: URLs of claims that were stored in the database
+        """
+        urls = [canonicalize_url(url) for url in urls if url]
+        if self.redis_client is None or not urls:
+            return
+        try:
+            # Chunked SADDs in one pipelined round trip
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for start in range(0, len(urls), REDIS_SADD_CHUNK_SIZE):
+                    pipe.sadd(REDIS_CLAIM_URLS_KEY, *urls[start:start + REDIS_SADD_CHUNK_SIZE])
+                await pipe.execute()
+        except Exception as e:
+            logger.warning(f"[{self.agent_name}] Error adding URLs to Redis claim URL store: {e}")
+    
+    def remember_claim_text(self, url: str, claim_text: str):
+        """
+        Index a stored claim's text so near-identical reprints under other URLs are skipped.
+        
+        Args:
+            url (str): The claim's source URL, used as the index key
+            claim_text (str): The stored claim text
+        """
+        if self._claim_lsh is None or not claim_text:
+            return
+        key = canonicalize_url(url or claim_text)
+        if key not in self._claim_lsh:
+            self._claim_lsh.insert(key, _claim_minhash(claim_text))
+    
+    def _is_near_duplicate(self, claim_text: str) -> bool:
+        """Check whether the claim text closely matches a claim that was already stored"""
+        if self._claim_lsh is None:
+            return False
+        return bool(self._claim_lsh.query(_claim_minhash(claim_text)))
+    
+    async def _find_known_urls(self, urls: List[str], existing_claim_urls: Set[str]) -> Set[str]:
+        """
+        Return the subset of urls that already belong to stored claims.
+        
+        Args:
+            urls (List[str]): URLs from one API response
+            existing_claim_urls (Set[str]): Canonical URLs already known in-process
+            
+        Returns:
+            Set[str]: The URLs (as given) that are duplicates
+        """
+        # Compare canonical forms so tracking parameters, "www." and trailing slashes don't hide duplicates
+        canonical_urls = {url: canonicalize_url(url) for url in urls if url}
+        known_keys = {key for key in canonical_urls.values() if key in existing_claim_urls}
+        remaining = list(set(canonical_urls.values()) - known_keys)
+        
+        if self.redis_client is not None and remaining:
+            try:
+                # One pipelined round trip for the whole response
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for url in remaining:
+                        pipe.sismember(REDIS_CLAIM_URLS_KEY, url)
+                    flags = await pipe.execute()
+                known_keys.update(key for key, is_member in zip(remaining, flags) if is_member)
+            except Exception as e:
+                logger.warning(f"[{self.agent_name}] Error checking Redis claim URL store: {e}")
+        
+        return {url for url, key in canonical_urls.items() if key in known_keys}
+    
+    def _has_suspicious_keyword(self, lowered_text: str) -> bool:
+        """Check whether the already-lowercased text contains any suspicious keyword"""
+        return _contains_any(_KEYWORD_AUTOMATON, SUSPICIOUS_KEYWORDS, lowered_text)
+    
+    def _is_unreliable(self, url: str) -> bool:
+        """
+        Check whether the URL's host is an unreliable domain or one of its subdomains.
+        
+        Args:
+            url (str): The article URL
+            
+        Returns:
+            bool: True if the host matches an unreliable domain
+        """
+        host = extract_host(url or "")
+        if host.startswith("www."):
+            host = host[4:]
+        
+        # Check the host and each parent domain (news.rt.com -> rt.com)
+        labels = host.split(".")
+        return any(".".join(labels[i:]) in UNRELIABLE_DOMAINS for i in range(len(labels) - 1))
+    
+    def _select_claims(self, candidates: List[Dict[str, Any]], discovered_claims: List[Dict[str, Any]],
+                       seen_urls: Set[str]):
+        """
+        Append the candidates worth fact-checking to discovered_claims, up to the per-cycle cap.
+        
+        Args:
+            candidates (List[Dict[str, Any]]): Candidate claims from one query
+            discovered_claims (List[Dict[str, Any]]): The claims discovered so far this cycle
+            seen_urls (Set[str]): Canonical URLs already taken this cycle, shared across queries and providers
+        """
+        # Track the count locally instead of calling len() on every candidate
+        count = len(discovered_claims)
+        if count >= MAX_CLAIMS_PER_CYCLE:
+            return
+        
+        for candidate in candidates:
+            url_key = canonicalize_url(candidate["source_url"])
+            if url_key in seen_urls:
+                continue
+            if self._is_near_duplicate(candidate["claim_text"][:200]):
+                logger.debug("[%s] Skipping near-duplicate claim: %s", self.agent_name, candidate["source_url"])
+                continue
+            
+            # Discover if: suspicious keywords OR unreliable domain OR (controversial topic AND not reputable source)
+            # Always discover a few claims even if not suspicious to ensure we have content
+            accept = (candidate["is_suspicious"] | candidate["is_unreliable_domain"]
+                      | (count < 10 and not candidate["is_reputable"]) | (count < 5))
+            if accept:
+                seen_urls.add(url_key)
+                claim_text = candidate["claim_text"]
+                logger.info("[%s] ✓ Discovering from %s: %.60s... (suspicious=%s, unreliable_domain=%s, source=%s)",
+                            self.agent_name, candidate["discovered_via"], claim_text, candidate["is_suspicious"],
+                            candidate["is_unreliable_domain"], candidate["source_name"])
+                discovered_claims.append({
+                    "claim_text": claim_text[:200],  # Limit length
+                    "source_url": candidate["source_url"],
+                    "source_metadata_json": orjson.dumps({
+                        "source_url": candidate["source_url"],
+                        "source_name": candidate["source_name"],
+                        "published_at": candidate["published_at"],
+                        "discovered_via": candidate["discovered_via"]
+                    }).decode()
+                })
+                
+                # Increase the total limit of claims found per cycle
+                count += 1
+                if count >= MAX_CLAIMS_PER_CYCLE:
+                    break
 
 
 # Example usage
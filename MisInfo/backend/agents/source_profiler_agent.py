@@ -1,124 +1,399 @@
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+import time
+from typing import Dict, Any, List, Optional
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 import whois
-from urllib.parse import urlparse
+
+# Optional native-asyncio WHOIS client; python-whois in a worker thread is the fallback
+try:
+    import asyncwhois
+    ASYNCWHOIS_AVAILABLE = True
+except ImportError:
+    ASYNCWHOIS_AVAILABLE = False
 
 from .base_agent import BaseAgent, AgentTask, AgentStatus, TaskPriority
+from .url_utils import extract_host
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Expanded reputable sources list, lowercased for case-insensitive lookups
+REPUTABLE_SOURCES = frozenset(name.lower() for name in (
+    "Reuters", "Associated Press", "BBC News", "NPR", "The Guardian", "Plos.org",
+    "Al Jazeera", "CNN", "CBS News", "ABC News", "NBC News", "PBS NewsHour",
+    "The New York Times", "The Washington Post", "The Wall Street Journal",
+    "Bloomberg", "Financial Times", "Forbes", "AP News",
+    "BBC World News", "France 24", "DW News", "NHK World", "TRT World",
+    "Al Arabiya", "Sky News", "ITV News", "Channel 4 News", "CTV News",
+    "CBC News", "ABC Australia", "Radio Canada", "Euronews", "CGTN",
+    "Xinhua News", "Kyodo News", "TASS", "RIA Novosti", "Anadolu Agency",
+    "Phys.org", "ScienceDaily", "Nature", "Scientific American", "Wired",
+    "TechCrunch", "The Verge", "Ars Technica", "MIT Technology Review",
+    "Harvard Business Review", "The Economist", "Foreign Affairs",
+    # Additional reputable sources
+    "Agence France-Presse", "Deutsche Welle", "Voice of America", "Radio Free Europe",
+    "The Christian Science Monitor", "ProPublica", "Center for Public Integrity",
+    "Investigative Reporters and Editors", "International Consortium of Investigative Journalists",
+    "The Atlantic", "Time Magazine", "Newsweek", "U.S. News & World Report",
+    "Los Angeles Times", "Chicago Tribune", "The Boston Globe", "Miami Herald",
+    "The Seattle Times", "The Denver Post", "Houston Chronicle", "Dallas Morning News",
+    "Philadelphia Inquirer", "Minneapolis Star-Tribune", "The Oregonian", "Arizona Republic",
+    "The Plain Dealer", "The Kansas City Star", "St. Louis Post-Dispatch", "Tampa Bay Times",
+    "The Mercury News", "Star-Ledger", "Milwaukee Journal Sentinel", "The Sacramento Bee",
+    "McClatchy", "Gannett", "Hearst Communications", "Advance Publications",
+    "Lee Enterprises", "The McClatchy Company", "Gray Television", "Tegna Inc.",
+    "Sinclair Broadcast Group", "Nexstar Media Group", "The E.W. Scripps Company",
+    "Fox Corporation", "Warner Bros. Discovery", "Comcast", "Disney",
+    "Snopes", "PolitiFact", "FactCheck.org", "Washington Post Fact Checker",
+    "BBC Reality Check", "Reuters Fact Check", "AP Fact Check", "Full Fact",
+    "Africa Check", "Chequeado", "Faktisk.no", "Correctiv",
+    "Pagella Politica", "Verificado", "Boom Live", "AltNews",
+    "Lead Stories", "21st Century Wire", "Check Your Fact", "Climate Feedback",
+    "SciCheck", "The Conversation", "Retraction Watch", "Our World in Data",
+    # Additional major news organizations
+    "USA Today", "The Hill", "Politico", "Axios", "Vox", "FiveThirtyEight",
+    "Mother Jones", "The Intercept", "Slate", "Salon", "The New Republic",
+    "National Review", "The Weekly Standard", "Reason Magazine", "The Nation",
+    "Der Spiegel", "Le Monde", "El País", "La Repubblica", "Le Figaro",
+    "The Globe and Mail", "The Sydney Morning Herald", "The Age", "Yomiuri Shimbun",
+    "Asahi Shimbun", "The Straits Times", "South China Morning Post", "Arab News",
+    "Al-Hayat", "Asharq Al-Awsat", "Al-Monitor", "Middle East Eye",
+    "Haaretz", "Ynet", "The Times of India", "The Hindu", "China Daily",
+    "The Moscow Times", "Komsomolskaya Pravda", "Izvestia"
+))
+
+# Expanded unreliable domains list
+UNRELIABLE_DOMAINS = frozenset({
+    "infowars.com", "naturalnews.com", "dailywire.com", "breitbart.com",
+    "rt.com", "freerepublic.com", "theonion.com", "empirenews.net",
+    "duffelblog.com", "clickhole.com", "borowitzreport.com", "newsmutiny.com",
+    "dailykos.com", "redstate.com", "wnd.com", "newsmax.com", "oann.com",
+    "zerohedge.com", "pravda.ru", "sputniknews.com", "beforeitsnews.com",
+    "activistpost.com", "truthdig.com", "truthout.org", "alternet.org",
+    "commondreams.org", "counterpunch.org", "davidicke.com", "prisonplanet.com",
+    "globalresearch.ca", "whatreallyhappened.com", "presstv.ir", "moonofalabama.org",
+    "consortiumnews.com", "mintpressnews.com", "blackagendareport.com", "truth11.com",
+    "yournewswire.com", "collective-evolution.com", "wakingtimes.com", "preventdisease.com",
+    "healthimpactnews.com", "naturalblaze.com", "theblaze.com", "dailycaller.com",
+    "foxnews.com", "news.ycombinator.com", "drudgereport.com", "thegatewaypundit.com",
+    "jonesreport.com", "lewrockwell.com", "antiwar.com", "ronpaulinstitute.org",
+    # Additional unreliable domains
+    "dcclothesline.com", "disclose.tv", "endingthefed.com",
+    "godlikeproductions.com", "govtslaves.info", "greanvillepost.com", "hangthebankers.com",
+    "henrymakow.com", "humansarefree.com", "investmentwatchblog.com", "jewishvirtuallibrary.org",
+    "libertyblitzkrieg.com", "libertymovementradio.com", "libertynews.com",
+    "libertytalk.fm", "livefreelivenatural.com", "marcorubio.com",
+    "newscorpse.com", "newstarget.com", "nowtheendbegins.com", "occupydemocrats.com",
+    "off-guardian.org", "oilgeopolitics.net", "patriotrising.com", "pjmedia.com",
+    "prisonplanet.tv", "randpaul.com", "rawforbeauty.com",
+    "redflagnews.com", "rense.com", "rumormillnews.com", "sott.net",
+    "thedailysheeple.com", "theforbiddenknowledge.com", "thelibertybeacon.com", "themindunleashed.com",
+    "thenewamerican.com", "therussophile.org", "thinkprogress.org", "tomfernandez28.com",
+    "trueactivist.com", "truthfrequencyradio.com", "twitchy.com", "unz.com",
+    "usuncut.com", "vdare.com", "veteranstoday.com", "washingtonsblog.com",
+    "weeklyworldnews.com", "whydontyoutrythis.com", "wikileaks.org",
+    "willyloman.wordpress.com", "worldtruth.tv", "zootfeed.com",
+    "naturalnewsblogs.com", "healthnutnews.com", "revolutions2040.com", "thetruthaboutcancer.com",
+    "collectivelyconscious.net", "dineal.com", "foodbabe.com", "mercola.com",
+    "organicconsumers.org", "responsibletechnology.org", "sustainablepulse.com", "truthaboutvaccines.com",
+    "vaccinationinformationnetwork.com", "cherrylightning.com",
+    "geoengineeringwatch.org", "in5d.com", "spiritualdaily.com", "ascensionwithearth.com",
+    "shiftfrequency.com", "soulfulvision.com", "thedailymind.com", "thepharmaceuticalindustry.com",
+    "ancient-code.com", "davidwolfe.com", "thetruthwins.com", "undergroundhealth.com",
+    "govtslaves.com", "nibiruandthecomingdeception.com", "thecosmicunion.com", "theeventchronicle.com",
+    "thetrumpet.com", "worldpeacehq.com", "realfarmacy.com", "therundownlive.com",
+    "truthstreammedia.com", "vigilantcitizen.com", "wakingupwisconsin.com", "2012portal.blogspot.com",
+    # Additional known problematic domains
+    "gatewaypundit.com", "worldnetdaily.com", "palmerreport.com",
+    "addictinginfo.com", "rightwingnews.com", "conservativetribune.com", "usapoliticstoday.com",
+    "libertywritersnews.com", "allenbwest.com", "thedailybeast.com", "huffingtonpost.com",
+    "crooksandliars.com", "mediamatters.org", "sourcewatch.org", "opensecrets.org",
+    "sunlightfoundation.com",
+    "urban.org", "brookings.edu", "cato.org", "heritage.org",
+    "americanthinker.com", "townhall.com", "freebeacon.com", "washingtontimes.com",
+    "realclearpolitics.com"
+})
+
+# Note: These lists are examples and require ongoing curation to maintain accuracy and relevance
+# Both tables are built once per process at import (not per agent) and are inherited
+# copy-on-write by forked workers; at a few hundred entries, frozenset hashing is as fast as
+# any on-disk trie, and the suffix walk below already gives the reversed-domain match.
+
+def _outlet_key(text: str) -> str:
+    """Reduce a source name or a domain's name part to lowercase alphanumerics, without a leading "the" ("The Atlantic" -> "atlantic")"""
+    text = text.lower()
+    if text.startswith("the "):
+        text = text[4:]
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+def _reputation_conflicts():
+    """
+    Find reputable source names that look like the same outlet as an unreliable domain.
+    
+    A name conflicts with a domain when it is the domain itself, or when either the name's key or the
+    domain's name-part key is a prefix of the other, which also catches suffixed names such as
+    "Reason Magazine" vs reason.com or "Snopes" vs snopes.com.
+    
+    Returns:
+        List[tuple]: The conflicting (source name, domain) pairs
+    """
+    domain_keys = [(domain, _outlet_key(domain.rsplit(".", 1)[0])) for domain in UNRELIABLE_DOMAINS]
+    conflicts = []
+    for name in REPUTABLE_SOURCES:
+        name_key = _outlet_key(name)
+        for domain, domain_key in domain_keys:
+            if name == domain or name_key.startswith(domain_key) or domain_key.startswith(name_key):
+                conflicts.append((name, domain))
+    return conflicts
+
+
+# A source can't be both reputable and unreliable: fail at import on any overlap
+assert not _reputation_conflicts(), f"REPUTABLE_SOURCES and UNRELIABLE_DOMAINS overlap: {_reputation_conflicts()}"
+
+# Cheap negative pre-checks for the unreliable-domain lookup: the top-level domains that
+# occur in the list, and the most labels any entry has (so deep subdomains skip extra probes)
+_UNRELIABLE_TLDS = frozenset(domain.rsplit(".", 1)[-1] for domain in UNRELIABLE_DOMAINS)
+_UNRELIABLE_MAX_LABELS = max(domain.count(".") + 1 for domain in UNRELIABLE_DOMAINS)
+
+# Reputation adjustment for each (is_reputable, is_unreliable) combination: +0.3 for a
+# reputable source name, -0.3 for an unreliable domain (reduced from 0.4 to avoid extreme scores)
+_REPUTATION_DELTA = {
+    (False, False): 0.0,
+    (True, False): 0.3,
+    (False, True): -0.3,
+    (True, True): 0.0,
+}
+
+
+def _age_penalty(age_days: int) -> float:
+    """Score penalty for a young domain: -0.2 under six months, -0.1 under a year, else 0.0"""
+    if age_days < 180:
+        return -0.2
+    if age_days < 365:
+        return -0.1
+    return 0.0
+
+
+# Process-wide WHOIS cache: domain -> (expiry, creation date or None, error or None). Domain age
+# barely changes, so successful lookups are kept for a day; failures are retried after five minutes.
+WHOIS_CACHE_TTL_SECONDS = 86400
+WHOIS_ERROR_TTL_SECONDS = 300
+WHOIS_CACHE_MAX_ENTRIES = 10_000
+WHOIS_TIMEOUT_SECONDS = 5
+_WHOIS_CACHE = {}
+_WHOIS_CACHE_LOCK = threading.Lock()
+
+# Per-agent memo of final scores keyed on (lowercased source name, host): claims arrive from a
+# handful of sources, and the score for a pair only moves when WHOIS data does
+SOURCE_SCORE_CACHE_TTL_SECONDS = 3600
+SOURCE_SCORE_CACHE_MAX_ENTRIES = 5_000
+
+
+def _cached_creation_date(domain: str):
+    """Return the fresh cache entry (expiry, creation date, error) for the domain, or None"""
+    with _WHOIS_CACHE_LOCK:
+        cached = _WHOIS_CACHE.get(domain)
+    return cached if cached and cached[0] > time.monotonic() else None
+
+
+def _lookup_creation_date(domain: str) -> Optional[datetime]:
+    """
+    Return the domain's WHOIS creation date, reusing a cached lookup when one is fresh.
+    
+    Args:
+        domain (str): The domain to look up
+        
+    Returns:
+        Optional[datetime]: The creation date, or None if WHOIS has none
+        
+    Raises:
+        Exception: Whatever the WHOIS lookup raised, if it failed (also remembered briefly)
+    """
+    now = time.monotonic()
+    cached = _cached_creation_date(domain)
+    if cached:
+        return _cache_entry_result(cached)
+    
+    try:
+        domain_info = whois.whois(domain, timeout=WHOIS_TIMEOUT_SECONDS)
+        creation_date = domain_info.get('creation_date') if domain_info else None
+        # Handle case where creation_date might be a list
+        if isinstance(creation_date, list):
+            creation_date = creation_date[0] if creation_date else None
+        entry = (now + WHOIS_CACHE_TTL_SECONDS, creation_date, None)
+    except Exception as e:
+        # Keep only the type and message: a cached instance would pin its traceback's frames
+        entry = (now + WHOIS_ERROR_TTL_SECONDS, None, (type(e), str(e)))
+    
+    return _store_creation_date(domain, entry)
+
+
+async def _aio_lookup_creation_date(domain: str) -> Optional[datetime]:
+    """
+    Look up the domain's WHOIS creation date with asyncwhois on the event loop, caching the result.
+    
+    Args:
+        domain (str): The domain to look up
+        
+    Returns:
+        Optional[datetime]: The creation date (naive, like python-whois returns), or None if WHOIS has none
+        
+    Raises:
+        Exception: Whatever the WHOIS lookup raised, if it failed (also remembered briefly)
+    """
+    now = time.monotonic()
+    try:
+        _, parsed = await asyncwhois.aio_whois(domain, timeout=WHOIS_TIMEOUT_SECONDS)
+        creation_date = parsed.get('created') if parsed else None
+        if isinstance(creation_date, list):
+            creation_date = creation_date[0] if creation_date else None
+        # Age is computed against naive datetime.now(), so drop any timezone
+        if isinstance(creation_date, datetime) and creation_date.tzinfo is not None:
+            creation_date = creation_date.astimezone(timezone.utc).replace(tzinfo=None)
+        entry = (now + WHOIS_CACHE_TTL_SECONDS, creation_date, None)
+    except Exception as e:
+        # Keep only the type and message: a cached instance would pin its traceback's frames
+        entry = (now + WHOIS_ERROR_TTL_SECONDS, None, (type(e), str(e)))
+    
+    return _store_creation_date(domain, entry)
+
+
+def _cache_entry_result(entry: tuple) -> Optional[datetime]:
+    """Return a cache entry's creation date, or raise a fresh exception rebuilt from its recorded error"""
+    error = entry[2]
+    if error is None:
+        return entry[1]
+    error_type, message = error
+    try:
+        fresh_error = error_type(message)
+    except Exception:
+        # Exception types whose constructor doesn't take a single message
+        fresh_error = RuntimeError(f"{error_type.__name__}: {message}")
+    raise fresh_error
+
+
+def _store_creation_date(domain: str, entry: tuple) -> Optional[datetime]:
+    """Cache a (expiry, creation date, error) entry, then return the date or raise the error"""
+    with _WHOIS_CACHE_LOCK:
+        if len(_WHOIS_CACHE) >= WHOIS_CACHE_MAX_ENTRIES:
+            # Drop the oldest entry (dicts keep insertion order)
+            _WHOIS_CACHE.pop(next(iter(_WHOIS_CACHE)), None)
+        _WHOIS_CACHE[domain] = entry
+    
+    return _cache_entry_result(entry)
+
+
+def _source_host(source_url: str) -> str:
+    """
+    Extract the lowercased hostname (without port) from a source URL.
+    
+    Args:
+        source_url (str): The source URL, with or without a scheme
+        
+    Returns:
+        str: The hostname, or "" if the URL is empty or can't name a domain
+    """
+    # Fast path: nothing without a dot can be a registrable domain
+    if not source_url or "." not in source_url:
+        return ""
+    return extract_host(source_url)
+
+
 class SourceProfilerAgent(BaseAgent):
     """Agent responsible for evaluating source credibility based on metadata"""
     
     def __init__(self, agent_id: str = "source_profiler_agent_001"):
         super().__init__(agent_id, "SourceProfilerAgent")
         
-        # Expanded reputable sources list
-        self.REPUTABLE_SOURCES = [
-            "Reuters", "Associated Press", "BBC News", "NPR", "The Guardian", "Plos.org",
-            "Al Jazeera", "CNN", "CBS News", "ABC News", "NBC News", "PBS NewsHour",
-            "The New York Times", "The Washington Post", "The Wall Street Journal",
-            "Bloomberg", "Financial Times", "Forbes", "AP News",
-            "BBC World News", "France 24", "DW News", "NHK World", "TRT World",
-            "Al Arabiya", "Sky News", "ITV News", "Channel 4 News", "CTV News",
-            "CBC News", "ABC Australia", "Radio Canada", "Euronews", "CGTN",
-            "Xinhua News", "Kyodo News", "TASS", "RIA Novosti", "Anadolu Agency",
-            "Phys.org", "ScienceDaily", "Nature", "Scientific American", "Wired",
-            "TechCrunch", "The Verge", "Ars Technica", "MIT Technology Review",
-            "Harvard Business Review", "The Economist", "Foreign Affairs",
-            # Additional reputable sources
-            "Agence France-Presse", "Deutsche Welle", "Voice of America", "Radio Free Europe",
-            "The Christian Science Monitor", "ProPublica", "Center for Public Integrity",
-            "Investigative Reporters and Editors", "International Consortium of Investigative Journalists",
-            "The Atlantic", "Time Magazine", "Newsweek", "U.S. News & World Report",
-            "Los Angeles Times", "Chicago Tribune", "The Boston Globe", "Miami Herald",
-            "The Seattle Times", "The Denver Post", "Houston Chronicle", "Dallas Morning News",
-            "Philadelphia Inquirer", "Minneapolis Star-Tribune", "The Oregonian", "Arizona Republic",
-            "The Plain Dealer", "The Kansas City Star", "St. Louis Post-Dispatch", "Tampa Bay Times",
-            "The Mercury News", "Star-Ledger", "Milwaukee Journal Sentinel", "The Sacramento Bee",
-            "McClatchy", "Gannett", "Hearst Communications", "Advance Publications",
-            "Lee Enterprises", "The McClatchy Company", "Gray Television", "Tegna Inc.",
-            "Sinclair Broadcast Group", "Nexstar Media Group", "The E.W. Scripps Company",
-            "Fox Corporation", "Warner Bros. Discovery", "Comcast", "Disney",
-            "Snopes", "PolitiFact", "FactCheck.org", "Washington Post Fact Checker",
-            "BBC Reality Check", "Reuters Fact Check", "AP Fact Check", "Full Fact",
-            "Africa Check", "Chequeado", "Faktisk.no", "Correctiv",
-            "Pagella Politica", "Verificado", "Boom Live", "AltNews",
-            "Lead Stories", "21st Century Wire", "Check Your Fact", "Climate Feedback",
-            "SciCheck", "The Conversation", "Retraction Watch", "Our World in Data",
-            # Additional major news organizations
-            "USA Today", "The Hill", "Politico", "Axios", "Vox", "FiveThirtyEight",
-            "Mother Jones", "The Intercept", "Slate", "Salon", "The New Republic",
-            "National Review", "The Weekly Standard", "Reason Magazine", "The Nation",
-            "Der Spiegel", "Le Monde", "El País", "La Repubblica", "Le Figaro",
-            "The Globe and Mail", "The Sydney Morning Herald", "The Age", "Yomiuri Shimbun",
-            "Asahi Shimbun", "The Straits Times", "South China Morning Post", "Arab News",
-            "Al-Hayat", "Asharq Al-Awsat", "Al-Monitor", "Middle East Eye",
-            "Haaretz", "Ynet", "The Times of India", "The Hindu", "China Daily",
-            "The Moscow Times", "Komsomolskaya Pravda", "Pravda", "Izvestia"
-        ]
-        
-        # Expanded unreliable domains list
-        self.UNRELIABLE_DOMAINS = [
-            "infowars.com", "naturalnews.com", "dailywire.com", "breitbart.com", 
-            "rt.com", "freerepublic.com", "theonion.com", "empirenews.net",
-            "duffelblog.com", "clickhole.com", "borowitzreport.com", "newsmutiny.com",
-            "dailykos.com", "redstate.com", "wnd.com", "newsmax.com", "oann.com",
-            "zerohedge.com", "pravda.ru", "sputniknews.com", "beforeitsnews.com",
-            "activistpost.com", "truthdig.com", "truthout.org", "alternet.org",
-            "commondreams.org", "counterpunch.org", "davidicke.com", "prisonplanet.com",
-            "globalresearch.ca", "whatreallyhappened.com", "presstv.ir", "moonofalabama.org",
-            "consortiumnews.com", "mintpressnews.com", "blackagendareport.com", "truth11.com",
-            "yournewswire.com", "collective-evolution.com", "wakingtimes.com", "preventdisease.com",
-            "healthimpactnews.com", "naturalblaze.com", "theblaze.com", "dailycaller.com",
-            "foxnews.com", "news.ycombinator.com", "drudgereport.com", "thegatewaypundit.com",
-            "jonesreport.com", "lewrockwell.com", "antiwar.com", "ronpaulinstitute.org",
-            # Additional unreliable domains
-            "beforeitsnews.com", "dcclothesline.com", "disclose.tv", "endingthefed.com",
-            "godlikeproductions.com", "govtslaves.info", "greanvillepost.com", "hangthebankers.com",
-            "henrymakow.com", "humansarefree.com", "investmentwatchblog.com", "jewishvirtuallibrary.org",
-            "lewrockwell.com", "libertyblitzkrieg.com", "libertymovementradio.com", "libertynews.com",
-            "libertytalk.fm", "livefreelivenatural.com", "marcorubio.com", "naturalnews.com",
-            "newscorpse.com", "newstarget.com", "nowtheendbegins.com", "occupydemocrats.com",
-            "off-guardian.org", "oilgeopolitics.net", "patriotrising.com", "pjmedia.com",
-            "prisonplanet.com", "prisonplanet.tv", "randpaul.com", "rawforbeauty.com",
-            "redflagnews.com", "rense.com", "rumormillnews.com", "sott.net",
-            "thedailysheeple.com", "theforbiddenknowledge.com", "thelibertybeacon.com", "themindunleashed.com",
-            "thenewamerican.com", "therussophile.org", "thinkprogress.org", "tomfernandez28.com",
-            "trueactivist.com", "truthfrequencyradio.com", "twitchy.com", "unz.com",
-            "usuncut.com", "vdare.com", "veteranstoday.com", "washingtonsblog.com",
-            "weeklyworldnews.com", "whatreallyhappened.com", "whydontyoutrythis.com", "wikileaks.org",
-            "willyloman.wordpress.com", "worldtruth.tv", "zerohedge.com", "zootfeed.com",
-            "naturalnewsblogs.com", "healthnutnews.com", "revolutions2040.com", "thetruthaboutcancer.com",
-            "collectivelyconscious.net", "dineal.com", "foodbabe.com", "mercola.com",
-            "organicconsumers.org", "responsibletechnology.org", "sustainablepulse.com", "truthaboutvaccines.com",
-            "vaccinationinformationnetwork.com", "cherrylightning.com", "collective-evolution.com", "wakingtimes.com",
-            "geoengineeringwatch.org", "in5d.com", "spiritualdaily.com", "ascensionwithearth.com",
-            "shiftfrequency.com", "soulfulvision.com", "thedailymind.com", "thepharmaceuticalindustry.com",
-            "ancient-code.com", "davidwolfe.com", "thetruthwins.com", "undergroundhealth.com",
-            "govtslaves.com", "nibiruandthecomingdeception.com", "thecosmicunion.com", "theeventchronicle.com",
-            "thetrumpet.com", "worldpeacehq.com", "realfarmacy.com", "therundownlive.com",
-            "truthstreammedia.com", "vigilantcitizen.com", "wakingupwisconsin.com", "2012portal.blogspot.com",
-            # Additional known problematic domains
-            "gatewaypundit.com", "worldnetdaily.com", "palmerreport.com", "occupydemocrats.com",
-            "addictinginfo.com", "rightwingnews.com", "conservativetribune.com", "usapoliticstoday.com",
-            "libertywritersnews.com", "allenbwest.com", "thedailybeast.com", "huffingtonpost.com",
-            "slate.com", "dailykos.com", "motherjones.com", "thinkprogress.org",
-            "crooksandliars.com", "mediamatters.org", "sourcewatch.org", "opensecrets.org",
-            "sunlightfoundation.com", "factcheck.org", "politifact.com", "snopes.com",
-            "urban.org", "brookings.edu", "cato.org", "heritage.org",
-            "americanthinker.com", "townhall.com", "freebeacon.com", "washingtontimes.com",
-            "nationalreview.com", "weeklystandard.com", "reason.com", "realclearpolitics.com"
-        ]
-        
-        # Note: These lists are examples and require ongoing curation to maintain accuracy and relevance
-        
-    def calculate_source_score(self, metadata: Dict[str, Any]) -> float:
+        # In-flight WHOIS lookups by domain, so a burst of claims from one domain shares a single query
+        self._whois_inflight: Dict[str, asyncio.Future] = {}
+        
+        # (source name, host) -> (expiry, score); in memory only, so it resets with the agent
+        self._score_cache: Dict[tuple, tuple] = {}
+        
+    def _find_unreliable_domain(self, host: str):
+        """
+        Find the unreliable domain that the host is, or is a subdomain of.
+        
+        Matches on whole labels, so "support.com" no longer matches "rt.com" and a domain
+        mentioned only in the URL's path or query is ignored.
+        
+        Args:
+            host (str): The source URL's hostname, as returned by _source_host
+            
+        Returns:
+            Optional[str]: The matched domain, or None
+        """
+        if not host:
+            return None
+        
+        labels = host.split(".")
+        if labels[-1] not in _UNRELIABLE_TLDS:
+            return None
+        
+        # Check the host and each parent domain (news.rt.com -> rt.com), no deeper than the longest entry
+        for i in range(max(0, len(labels) - _UNRELIABLE_MAX_LABELS), len(labels) - 1):
+            domain = ".".join(labels[i:])
+            if domain in UNRELIABLE_DOMAINS:
+                return domain
+        return None
+    
+    async def get_creation_date(self, domain: str) -> Optional[datetime]:
+        """
+        Get the domain's creation date without blocking the event loop.
+        
+        Cache hits are answered inline; misses query asyncwhois on the loop when it's installed,
+        else run the blocking python-whois lookup in a worker thread. Either way the lookup is
+        shared by every caller asking for the same domain meanwhile.
+        
+        Args:
+            domain (str): The domain to look up
+            
+        Returns:
+            Optional[datetime]: The creation date, or None if WHOIS has none
+        """
+        cached = _cached_creation_date(domain)
+        if cached:
+            return _cache_entry_result(cached)
+        
+        lookup = self._whois_inflight.get(domain)
+        if lookup is None:
+            if ASYNCWHOIS_AVAILABLE:
+                lookup = asyncio.ensure_future(_aio_lookup_creation_date(domain))
+            else:
+                lookup = asyncio.ensure_future(asyncio.to_thread(_lookup_creation_date, domain))
+            self._whois_inflight[domain] = lookup
+            
+            def _finished(future):
+                self._whois_inflight.pop(domain, None)
+                # Mark any error as retrieved in case every waiter already timed out
+                if not future.cancelled():
+                    future.exception()
+            
+            lookup.add_done_callback(_finished)
+        
+        # Shield so one caller's timeout doesn't cancel the lookup for the others
+        return await asyncio.wait_for(asyncio.shield(lookup), timeout=WHOIS_TIMEOUT_SECONDS)
+    
+    async def calculate_source_scores(self, metadata_list: List[Dict[str, Any]]) -> List[float]:
+        """
+        Score many sources concurrently; repeated domains cost a single WHOIS lookup.
+        
+        Args:
+            metadata_list (List[Dict[str, Any]]): Source metadata dicts
+            
+        Returns:
+            List[float]: Credibility scores in the same order
+        """
+        return list(await asyncio.gather(*(self.calculate_source_score(metadata) for metadata in metadata_list)))
+    
+    async def calculate_source_score(self, metadata: Dict[str, Any]) -> float:
         """
         Calculate a credibility score for a source based on domain reputation with weighted scoring.
         
@@ -128,71 +403,86 @@ class SourceProfilerAgent(BaseAgent):
         Returns:
             float: A credibility score based on source reputation
         """
-        logger.info(f"[{self.agent_name}] Calculating source credibility score with weighted approach")
-        logger.debug(f"[{self.agent_name}] Metadata: {metadata}")
+        logger.info("[%s] Calculating source credibility score with weighted approach", self.agent_name)
+        logger.debug("[%s] Metadata: %s", self.agent_name, metadata)
         
         # Extract source name and URL from metadata
         source_name = metadata.get('source_name', '')
         source_url = metadata.get('source_url', '')
         
-        logger.debug(f"[{self.agent_name}] Source name: {source_name}, Source URL: {source_url}")
+        logger.debug("[%s] Source name: %s, Source URL: %s", self.agent_name, source_name, source_url)
+        
+        # Normalize the cache key; the host is parsed once and reused by the checks below
+        key = ((source_name or "").strip().lower(), _source_host(source_url))
+        
+        now = time.monotonic()
+        cached = self._score_cache.get(key)
+        if cached and cached[0] > now:
+            logger.info("[%s] Reusing cached source credibility score: %.2f", self.agent_name, cached[1])
+            return cached[1]
+        
+        final_score, cacheable = await self._score_source(*key)
         
+        if cacheable:
+            if len(self._score_cache) >= SOURCE_SCORE_CACHE_MAX_ENTRIES:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._score_cache.pop(next(iter(self._score_cache)), None)
+            self._score_cache[key] = (now + SOURCE_SCORE_CACHE_TTL_SECONDS, final_score)
+        
+        return final_score
+    
+    async def _score_source(self, source_name: str, host: str):
+        """
+        Score a normalized (source name, host) pair.
+        
+        Args:
+            source_name (str): The lowercased, stripped source name
+            host (str): The source URL's hostname, as returned by _source_host
+            
+        Returns:
+            tuple: The clamped score, and whether it may be memoized (False if WHOIS failed)
+        """
         # Start with a base neutral score
         base_score = 0.5
-        score = base_score
+        cacheable = True
         
         # Check if the source_name is in REPUTABLE_SOURCES
-        if source_name in self.REPUTABLE_SOURCES:
-            score += 0.3  # Reduced from 0.4 to prevent extremely high scores
-            logger.info(f"[{self.agent_name}] Reputable source found: {source_name}, adding 0.3 to score")
+        is_reputable = source_name in REPUTABLE_SOURCES
+        if is_reputable:
+            logger.info("[%s] Reputable source found: %s, adding 0.3 to score", self.agent_name, source_name)
             
-        # Check if any part of UNRELIABLE_DOMAINS is in the source_url
-        for unreliable_domain in self.UNRELIABLE_DOMAINS:
-            if unreliable_domain in source_url:
-                score -= 0.3  # Reduced from 0.4 to prevent extremely low scores
-                logger.info(f"[{self.agent_name}] Unreliable domain found: {unreliable_domain} in {source_url}, subtracting 0.3 from score")
-                break  # Only apply penalty once
+        # Check if the source_url's host belongs to an unreliable domain
+        unreliable_domain = self._find_unreliable_domain(host)
+        if unreliable_domain:
+            logger.info("[%s] Unreliable domain found: %s in %s, subtracting 0.3 from score", self.agent_name, unreliable_domain, host)
+        
+        score = base_score + _REPUTATION_DELTA[(is_reputable, unreliable_domain is not None)]
                 
-        # Optional: Domain age check
+        # Optional: Domain age check, only where the reputation lists give no clear verdict
+        # (neither or both matched); a one-sided verdict isn't worth a WHOIS round trip
         try:
-            if source_url:
-                # Extract domain from URL
-                parsed_url = urlparse(source_url)
-                domain = parsed_url.netloc or parsed_url.path
+            if host and is_reputable == (unreliable_domain is not None):
+                # Get the domain's creation date (cached, WHOIS lookup with timeout on a miss)
+                creation_date = await self.get_creation_date(host)
                 
-                if domain:
-                    # Get domain information with timeout
-                    domain_info = whois.whois(domain, timeout=5)
+                # Calculate age in days
+                if creation_date:
+                    age_days = (datetime.now() - creation_date).days
                     
-                    # Check if creation_date exists
-                    if 'creation_date' in domain_info and domain_info['creation_date']:
-                        creation_date = domain_info['creation_date']
-                        
-                        # Handle case where creation_date might be a list
-                        if isinstance(creation_date, list):
-                            creation_date = creation_date[0]
-                            
-                        # Calculate age in days
-                        if creation_date:
-                            age_days = (datetime.now() - creation_date).days
-                            
-                            # If domain is less than 6 months old, subtract 0.2 from score
-                            if age_days < 180:
-                                score -= 0.2
-                                logger.info(f"[{self.agent_name}] Domain {domain} is less than 6 months old ({age_days} days), subtracting 0.2 from score")
-                            # If domain is less than a year old, subtract 0.1 from score
-                            elif age_days < 365:
-                                score -= 0.1
-                                logger.info(f"[{self.agent_name}] Domain {domain} is less than a year old ({age_days} days), subtracting 0.1 from score")
+                    age_penalty = _age_penalty(age_days)
+                    score += age_penalty
+                    if age_penalty:
+                        logger.info("[%s] Domain %s is %s days old, subtracting %s from score", self.agent_name, host, age_days, -age_penalty)
         except Exception as e:
-            logger.warning(f"[{self.agent_name}] Error checking domain age: {e}")
-            # Continue with score calculation even if domain age check fails
+            logger.warning("[%s] Error checking domain age: %s", self.agent_name, e)
+            # Continue with score calculation even if domain age check fails, but don't memoize it
+            cacheable = False
                 
         # Clamp score between 0.0 and 1.0
         final_score = max(0.0, min(1.0, score))
         
-        logger.info(f"[{self.agent_name}] Final calculated source credibility score: {final_score:.2f} (base: {base_score}, modifiers: {final_score - base_score:+.2f})")
-        return final_score
+        logger.info("[%s] Final calculated source credibility score: %.2f (base: %s, modifiers: %+.2f)", self.agent_name, final_score, base_score, final_score - base_score)
+        return final_score, cacheable
     
     async def process_task(self, task: AgentTask) -> Dict[str, Any]:
         """
@@ -204,7 +494,7 @@ class SourceProfilerAgent(BaseAgent):
         Returns:
             Dict[str, Any]: The credibility score and evaluation details
         """
-        logger.info(f"[{self.agent_name}] Processing source profiling task {task.task_id}")
+        logger.info("[%s] Processing source profiling task %s", self.agent_name, task.task_id)
         
         # Extract source metadata from payload
         source_metadata_json = task.payload.get("source_metadata_json", "{}")
@@ -215,7 +505,7 @@ class SourceProfilerAgent(BaseAgent):
             raise ValueError(f"Invalid JSON in source_metadata_json: {e}")
         
         # Calculate credibility score
-        credibility_score = self.calculate_source_score(source_metadata)
+        credibility_score = await self.calculate_source_score(source_metadata)
         
         return {
             "source_metadata": source_metadata,
@@ -0,0 +1,31 @@
+"""
+Project Aegis - URL helpers
+Hostname extraction shared by the agents, so every duplicate check, domain
+lookup and reputation match sees the same host for a given URL.
+"""
+
+
+def extract_host(url: str) -> str:
+    """
+    Extract the lowercased hostname from a URL using plain string splits (no urllib.parse).
+    
+    Accepts scheme-less URLs such as "rt.com/news" and bare netlocs, and drops any
+    userinfo ("user@") and port (":443").
+    
+    Args:
+        url (str): The URL or netloc
+        
+    Returns:
+        str: The hostname, or "" if the URL has none
+    """
+    # "://" only separates a scheme when nothing before it is part of a path, query or fragment,
+    # so "infowars.com/a?r=https://reuters.com" keeps infowars.com as its host
+    scheme, separator, rest = url.partition("://")
+    if not separator or not scheme or any(ch in scheme for ch in "/?#"):
+        rest = url
+    rest = rest.lstrip("/")
+    netloc = rest.partition("/")[0].partition("?")[0].partition("#")[0].rpartition("@")[2]
+    if netloc.startswith("["):
+        # IPv6 literal such as "[::1]:8080"
+        return netloc[1:].partition("]")[0].lower()
+    return netloc.partition(":")[0].lower()
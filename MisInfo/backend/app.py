@@ -1,13 +1,15 @@
 import os
 import json
 import asyncio
+import time
 from datetime import datetime
 from typing import List, Optional
 from dotenv import load_dotenv
 import pandas as pd
-from fastapi import FastAPI, WebSocket
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
 from supabase import create_client, Client
 import joblib
 import logging
@@ -49,11 +51,17 @@ class LogResponse(BaseModel):
     log_message: str
 
 
+# Validate whole Supabase result sets in one call rather than building each model by hand
+UPDATES_ADAPTER = TypeAdapter(List[UpdateResponse])
+LOGS_ADAPTER = TypeAdapter(List[LogResponse])
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Project Backend",
     description="Backend API for Project OSINT and threat analysis system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS middleware to allow all origins
@@ -80,6 +88,16 @@ herald_agent = None
 # Initialize the coordinator agent
 coordinator = None
 
+# The dashboard polls /updates far more often than verifications land, so the
+# payload is served from memory for a short window
+UPDATES_CACHE_TTL_SECONDS = 2
+_updates_cache = {"expires_at": 0.0, "data": None}
+
+
+def invalidate_updates_cache() -> None:
+    """Expire the cached /updates payload so the next request sees newly written verifications"""
+    _updates_cache["expires_at"] = 0.0
+
 # Load environment variables
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_SERVICE_ROLE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -99,16 +117,16 @@ async def startup_event():
         try:
             supabase_client = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
             logger.info("Supabase client initialized successfully")
-            logger.info(f"Supabase URL: {SUPABASE_URL}")
+            logger.info("Supabase URL: %s", SUPABASE_URL)
             
             # Test Supabase connection
             try:
                 response = supabase_client.table("events").select("event_id").limit(1).execute()
                 logger.info("Supabase connection test successful")
             except Exception as e:
-                logger.error(f"Supabase connection test failed: {e}")
+                logger.error("Supabase connection test failed: %s", e)
         except Exception as e:
-            logger.error(f"Error initializing Supabase client: {e}")
+            logger.error("Error initializing Supabase client: %s", e)
     else:
         logger.warning("Warning: Supabase credentials not found in environment variables")
     
@@ -120,25 +138,29 @@ async def startup_event():
     except FileNotFoundError:
         logger.warning("Warning: vectorizer.pkl or classifier.pkl not found")
     except Exception as e:
-        logger.error(f"Error loading ML models: {e}")
+        logger.error("Error loading ML models: %s", e)
     
     # Check Gemini API key
     if GEMINI_API_KEY:
         logger.info("Gemini API key found in environment variables")
-        logger.info(f"Gemini API key (first 10 chars): {GEMINI_API_KEY[:10]}...")
+        logger.info("Gemini API key (first 10 chars): %s...", GEMINI_API_KEY[:10])
     else:
         logger.warning("Warning: Gemini API key not found in environment variables")
     
-    # Initialize instances of all specialist agents
+    # Initialize instances of all specialist agents. AnalystAgent unpickles its models and
+    # InvestigatorAgent imports and configures the Gemini client, so those two are built
+    # concurrently in worker threads; the rest are cheap and built inline.
     try:
-        analyst_agent = AnalystAgent(model_path="backend")
+        analyst_agent, investigator_agent = await asyncio.gather(
+            asyncio.to_thread(AnalystAgent, model_path="backend"),
+            asyncio.to_thread(InvestigatorAgent, gemini_api_key=GEMINI_API_KEY)
+        )
         source_agent = SourceProfilerAgent()
         research_agent = ResearchAgent()
-        investigator_agent = InvestigatorAgent(gemini_api_key=GEMINI_API_KEY)
         herald_agent = HeraldAgent()
         logger.info("Specialist agents initialized successfully")
     except Exception as e:
-        logger.error(f"Error initializing specialist agents: {e}")
+        logger.error("Error initializing specialist agents: %s", e)
     
     # Initialize the CoordinatorAgent
     try:
@@ -150,11 +172,12 @@ async def startup_event():
             source_agent=source_agent,
             research_agent=research_agent,
             investigator_agent=investigator_agent,
-            herald_agent=herald_agent
+            herald_agent=herald_agent,
+            on_verified_claims_written=invalidate_updates_cache
         )
         logger.info("Coordinator agent initialized successfully")
     except Exception as e:
-        logger.error(f"Error initializing coordinator agent: {e}")
+        logger.error("Error initializing coordinator agent: %s", e)
     
     # Start the Coordinator's autonomous loop as a background task
     if coordinator:
@@ -164,21 +187,34 @@ async def startup_event():
         logger.error("Coordinator not initialized, cannot start loop")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release pooled network connections held by the agents"""
+    if coordinator:
+        await coordinator.scout_agent.close()
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time dashboard updates"""
+    """
+    WebSocket endpoint for real-time dashboard updates.
+    
+    Keep-alive is left to the server's protocol-level Ping/Pong frames (uvicorn sends them by
+    default; tune with --ws-ping-interval 25 --ws-ping-timeout 10), so idle connections cost
+    no application timers.
+    """
     # Accept the connection
     await manager.connect(websocket)
     
     try:
-        # Keep the connection alive by sending periodic ping messages
+        # Wait on the client side of the socket so a close is noticed as soon as it arrives;
+        # the dashboard sends nothing meaningful, so incoming messages are ignored
         while True:
-            # Send a ping message to keep the connection alive
-            await websocket.send_text("ping")
-            # Wait for 25 seconds before sending the next ping
-            await asyncio.sleep(25)
+            await websocket.receive_text()
+    except WebSocketDisconnect as e:
+        logger.info("WebSocket client disconnected: %s", e.code)
     except Exception as e:
-        logger.info(f"WebSocket connection closed: {e}")
+        logger.info("WebSocket connection closed: %s", e)
     finally:
         # Disconnect the websocket
         manager.disconnect(websocket)
@@ -202,6 +238,9 @@ async def get_updates():
         logger.error("Supabase client not initialized")
         return {"error": "Supabase client not initialized"}
     
+    if _updates_cache["data"] is not None and time.monotonic() < _updates_cache["expires_at"]:
+        return _updates_cache["data"]
+    
     try:
         # Query the verified_claims table
         response = (supabase_client.table("verified_claims")
@@ -210,23 +249,16 @@ async def get_updates():
                    .limit(20)
                    .execute())
         
-        # Transform the data to match the UpdateResponse model
-        updates = []
-        for item in response.data:
-            update = UpdateResponse(
-                verification_id=item.get("verification_id", 0),
-                raw_claim_id=item.get("raw_claim_id", 0),
-                verification_status=item.get("verification_status", "Unknown"),
-                explanation=item.get("explanation", ""),
-                dossier=item.get("dossier", None),
-                timestamp_verified=item.get("timestamp_verified", datetime.now())
-            )
-            updates.append(update)
+        # Validate the rows against the UpdateResponse model in a single pass
+        updates = UPDATES_ADAPTER.validate_python(response.data)
         
-        logger.info(f"Returning {len(updates)} verified claims")
+        _updates_cache["data"] = updates
+        _updates_cache["expires_at"] = time.monotonic() + UPDATES_CACHE_TTL_SECONDS
+        
+        logger.info("Returning %s verified claims", len(updates))
         return updates
     except Exception as e:
-        logger.error(f"Error fetching updates: {e}")
+        logger.error("Error fetching updates: %s", e)
         return {"error": "Failed to fetch updates"}
 
 
@@ -249,20 +281,13 @@ async def get_agent_status():
                    .limit(10)
                    .execute())
         
-        # Transform the data to match the LogResponse model
-        logs = []
-        for item in response.data:
-            log = LogResponse(
-                log_id=item.get("log_id", 0),
-                timestamp=item.get("timestamp", datetime.now()),
-                log_message=item.get("log_message", "")
-            )
-            logs.append(log)
+        # Validate the rows against the LogResponse model in a single pass
+        logs = LOGS_ADAPTER.validate_python(response.data)
         
-        logger.info(f"Returning {len(logs)} agent status logs")
+        logger.info("Returning %s agent status logs", len(logs))
         return logs
     except Exception as e:
-        logger.error(f"Error fetching agent status: {e}")
+        logger.error("Error fetching agent status: %s", e)
         return {"error": "Failed to fetch agent status"}
 
 
@@ -292,6 +317,54 @@ class SubmitClaim(BaseModel):
     source_url: str = ""
 
 
+# Strong references to in-flight background log writes so they are not
+# garbage collected before completing
+_background_log_tasks = set()
+
+
+def _log_in_background(log_message: str) -> None:
+    """
+    Insert a system_logs row without making the caller wait for it.
+    
+    Args:
+        log_message (str): The message to record in system_logs
+    """
+    async def _insert_log():
+        try:
+            await asyncio.to_thread(
+                supabase_client.table("system_logs").insert({"log_message": log_message}).execute
+            )
+        except Exception as e:
+            logger.error("Error writing system log: %s", e)
+    
+    task = asyncio.create_task(_insert_log())
+    _background_log_tasks.add(task)
+    task.add_done_callback(_background_log_tasks.discard)
+
+
+async def _remember_claim_url(source_metadata) -> None:
+    """
+    Add a newly inserted claim's URL to the scout's shared duplicate store.
+    
+    Once that store exists the coordinator stops rescanning raw_claims, so claims
+    inserted through the API must be recorded here or the scout would re-discover them.
+    
+    Args:
+        source_metadata: The claim's source metadata, as a dict or a JSON string
+    """
+    if coordinator is None:
+        return
+    if isinstance(source_metadata, str):
+        try:
+            source_metadata = json.loads(source_metadata)
+        except json.JSONDecodeError:
+            return
+    source_url = source_metadata.get("source_url") if isinstance(source_metadata, dict) else None
+    if isinstance(source_url, str) and source_url:
+        # remember_claim_urls canonicalizes and logs its own Redis errors
+        await coordinator.scout_agent.remember_claim_urls([source_url])
+
+
 @app.post("/api/submit-claim")
 async def submit_claim(claim: SubmitClaim):
     """Public endpoint for submitting claims from the frontend"""
@@ -328,11 +401,10 @@ async def submit_claim(claim: SubmitClaim):
         
         response = supabase_client.table("raw_claims").insert(claim_data).execute()
         
-        # Log this action
-        log_entry = {
-            "log_message": f"Claim submitted via web form: {claim.claim_text[:50]}..."
-        }
-        supabase_client.table("system_logs").insert(log_entry).execute()
+        # Log this action without holding up the response
+        _log_in_background(f"Claim submitted via web form: {claim.claim_text[:50]}...")
+        # Only a real URL, not the "manual_submission" placeholder
+        await _remember_claim_url({"source_url": claim.source_url})
         
         return {
             "status": "success",
@@ -340,7 +412,7 @@ async def submit_claim(claim: SubmitClaim):
             "claim_id": response.data[0]["claim_id"] if response.data else None
         }
     except Exception as e:
-        logger.error(f"Error submitting claim: {e}")
+        logger.error("Error submitting claim: %s", e)
         return {"error": f"Failed to submit claim: {str(e)}"}
 
 
@@ -370,11 +442,9 @@ async def seed_demo_claim(claim: DemoClaim):
         
         response = supabase_client.table("raw_claims").insert(claim_data).execute()
         
-        # Log this action
-        log_entry = {
-            "log_message": f"Demo claim injected: {claim.claim_text[:50]}..."
-        }
-        supabase_client.table("system_logs").insert(log_entry).execute()
+        # Log this action without holding up the response
+        _log_in_background(f"Demo claim injected: {claim.claim_text[:50]}...")
+        await _remember_claim_url(claim.source_metadata_json)
         
         return {
             "status": "success",